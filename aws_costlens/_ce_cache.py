@@ -0,0 +1,112 @@
+"""On-disk cache for Cost Explorer GetCostAndUsage results."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+from aws_costlens._clients import _cache_disabled
+
+# Closed months no longer change; the current one keeps filling in
+CLOSED_PERIOD_TTL = 6 * 3600
+OPEN_PERIOD_TTL = 3600
+
+
+def _ce_cache_disabled() -> bool:
+    """Whether COSTLENS_DISABLE_CE_CACHE=1 (or the session cache switch) is set."""
+    return os.environ.get("COSTLENS_DISABLE_CE_CACHE") == "1" or _cache_disabled()
+
+
+def _cache_dir() -> str:
+    """Directory holding cached responses ($XDG_CACHE_HOME or ~/.cache)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "aws-costlens")
+
+
+def _ttl(params: Dict[str, Any]) -> int:
+    """Seconds a result stays fresh: shorter when the range reaches this month."""
+    # End is exclusive, so only a later End includes days of the current month
+    this_month = date.today().replace(day=1).isoformat()
+    return (
+        OPEN_PERIOD_TTL
+        if params["TimePeriod"]["End"] > this_month
+        else CLOSED_PERIOD_TTL
+    )
+
+
+def _read(path: str, ttl: int) -> Optional[List[Dict]]:
+    """Return the cached results at path if younger than ttl seconds."""
+    try:
+        if time.time() - os.stat(path).st_mtime >= ttl:
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            results: List[Dict] = json.load(f)
+        return results
+    except (OSError, ValueError):
+        return None
+
+
+def _write(path: str, results: List[Dict]) -> None:
+    """Store results at path; a cache that cannot be written is skipped."""
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        # Billing data: readable by the current user only
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, "w", encoding="utf-8") as f:
+            json.dump(results, f)
+        # Atomic, so concurrent profiles never read a half-written file
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def get_cost_and_usage(
+    ce: Any, params: Dict[str, Any], account_id: Optional[str]
+) -> List[Dict]:
+    """
+    Return every ResultsByTime entry of a GetCostAndUsage request.
+
+    Follows NextPageToken across pages. Results are cached on disk per
+    (account, request parameters) for OPEN_PERIOD_TTL when the range reaches
+    the current month and CLOSED_PERIOD_TTL otherwise, since each Cost
+    Explorer request is billed. Nothing is cached without an account ID or
+    when COSTLENS_DISABLE_CE_CACHE=1 (set by the --no-cache CLI flag).
+
+    Args:
+        ce: Cost Explorer client
+        params: get_cost_and_usage keyword arguments (without NextPageToken)
+        account_id: Account the client belongs to
+    """
+    path = None
+    if account_id and not _ce_cache_disabled():
+        key = json.dumps([account_id, params], sort_keys=True)
+        path = os.path.join(
+            _cache_dir(), hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json"
+        )
+        cached = _read(path, _ttl(params))
+        if cached is not None:
+            return cached
+
+    results: List[Dict] = []
+    request = dict(params)
+    while True:
+        response = ce.get_cost_and_usage(**request)
+        results.extend(response.get("ResultsByTime", []))
+        # get_cost_and_usage has no botocore paginator
+        token = response.get("NextPageToken")
+        if not token:
+            break
+        request["NextPageToken"] = token
+
+    if path:
+        _write(path, results)
+    return results
@@ -0,0 +1,117 @@
+"""Cached boto3 sessions and clients shared across CostLens."""
+
+import os
+import threading
+from functools import lru_cache
+from typing import Any, Optional
+
+import boto3
+from boto3.session import Session
+
+# boto3 clients are thread-safe, the Session that creates them is not.
+_client_lock = threading.Lock()
+
+
+def _use_orjson_for_responses() -> None:
+    """
+    Parse JSON-protocol response bodies with orjson.
+
+    Of the services CostLens calls, this covers Cost Explorer, Budgets
+    (json) and Lambda (rest-json). STS, EC2, RDS, ELBv2 and S3 answer in
+    XML and are not affected.
+
+    orjson reads the raw bytes without decoding them first. Bodies it
+    rejects (e.g. non-standard NaN literals) go to botocore's own parser, so
+    parsed results are unchanged. Skipped when orjson or the parser hook is
+    missing.
+    """
+    try:
+        import orjson
+        from botocore.parsers import BaseJSONParser
+    except ImportError:
+        return
+
+    original = getattr(BaseJSONParser, "_parse_body_as_json", None)
+    if original is None or getattr(original, "_costlens_orjson", False):
+        return
+
+    def _parse_body_as_json(self: Any, body_contents: bytes) -> Any:
+        if not body_contents:
+            return {}
+        try:
+            return orjson.loads(body_contents)
+        except orjson.JSONDecodeError:
+            return original(self, body_contents)
+
+    _parse_body_as_json._costlens_orjson = True  # type: ignore[attr-defined]
+    setattr(BaseJSONParser, "_parse_body_as_json", _parse_body_as_json)
+
+
+_use_orjson_for_responses()
+
+
+def _cache_disabled() -> bool:
+    """Whether COSTLENS_DISABLE_SESSION_CACHE=1 asks for fresh objects."""
+    return os.environ.get("COSTLENS_DISABLE_SESSION_CACHE") == "1"
+
+
+def _new_session(profile: str) -> Session:
+    """Create a boto3 Session for a profile with its credentials resolved."""
+    session = boto3.Session(profile_name=profile)
+    # Run the credential chain here rather than in the first client creation,
+    # which holds _client_lock and would serialize every profile's resolution.
+    # Clients still read the session's (refreshable) credentials.
+    try:
+        session.get_credentials()
+    except Exception:
+        # Left for client creation to raise where callers handle it
+        pass
+    return session
+
+
+@lru_cache(maxsize=None)
+def _cached_session(profile: str) -> Session:
+    """Create the boto3 Session for a profile once per process."""
+    return _new_session(profile)
+
+
+def get_session(profile: str) -> Session:
+    """
+    Get a boto3 Session for a profile, reusing it across calls.
+
+    Creating a Session resolves credentials (config parsing, STS calls for
+    assumed roles), so it is cached per profile. Set
+    COSTLENS_DISABLE_SESSION_CACHE=1 to always create a fresh Session
+    (e.g. when tests patch AWS between calls).
+    """
+    if _cache_disabled():
+        return _new_session(profile)
+    return _cached_session(profile)
+
+
+def _create_client(session: Session, service: str, region: Optional[str]) -> Any:
+    """Create a boto3 client, serializing creation on the shared session."""
+    with _client_lock:
+        # The boto3 stubs only type client() for literal service names
+        return session.client(service, region_name=region)  # type: ignore[call-overload]
+
+
+@lru_cache(maxsize=None)
+def _cached_client(session: Session, service: str, region: Optional[str]) -> Any:
+    """Create a client once per (session, service, region)."""
+    return _create_client(session, service, region)
+
+
+def get_client(session: Session, service: str, region: Optional[str] = None) -> Any:
+    """
+    Get a boto3 client for a service and region, reusing it across calls.
+
+    Building a client loads and parses the service model, which is costly,
+    so clients are cached per session. Sessions are themselves cached per
+    profile (see get_session), which makes this a per (profile, service,
+    region) cache. Clients are safe to share between threads.
+    COSTLENS_DISABLE_SESSION_CACHE=1 bypasses this cache as well.
+    """
+    if _cache_disabled():
+        return _create_client(session, service, region)
+    return _cached_client(session, service, region)
@@ -0,0 +1,21 @@
+"""Regions served by AWS services that only answer on a single endpoint."""
+
+from typing import Dict, FrozenSet
+
+from aws_costlens.models import RegionName
+
+# Cost Explorer, Budgets and IAM are global: every region but their home one
+# either fails or proxies back to it, so never fan these out per region.
+SERVICE_REGIONS: Dict[str, FrozenSet[RegionName]] = {
+    "ce": frozenset({"us-east-1"}),
+    "budgets": frozenset({"us-east-1"}),
+    "iam": frozenset({"us-east-1"}),
+}
+
+
+def home_region(service: str, default: RegionName = "us-east-1") -> RegionName:
+    """Return the region to call a single-endpoint service in."""
+    regions = SERVICE_REGIONS.get(service)
+    if not regions:
+        return default
+    return min(regions)
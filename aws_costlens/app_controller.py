@@ -2,18 +2,17 @@
 
 import os
 from collections import defaultdict
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, Union
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import replace
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar, Union
 
-import boto3
 from rich import box
-from rich.console import Console
 from rich.progress import track
 from rich.status import Status
 from rich.table import Column, Table
 
 # Setup UTF-8 console for Windows
-from aws_costlens.console_setup import setup_console
+from aws_costlens.console_setup import console, setup_console
 setup_console()
 
 from aws_costlens.aws_api import (
@@ -21,6 +20,7 @@ from aws_costlens.aws_api import (
     get_account_id,
     get_aws_profiles,
     get_budgets,
+    get_session,
     get_stopped_instances,
     get_unused_eips,
     get_unused_volumes,
@@ -30,39 +30,114 @@ from aws_costlens.cost_controller import (
     export_to_csv,
     export_to_json,
     export_to_xlsx,
-    get_cost_data,
     get_trend,
+    resolve_periods,
 )
 from aws_costlens.report_exporter import ExportHandler
 from aws_costlens.common_utils import (
+    AUDIT_CSV_HEADER,
     clean_rich_tags,
-    export_audit_report_to_csv,
     export_audit_report_to_json,
+    export_audit_report_to_parquet,
     export_audit_report_to_pdf,
     export_cost_dashboard_to_pdf,
     export_trend_data_to_json,
+    iter_audit_rows,
 )
 from aws_costlens.profiles_controller import process_combined_profiles, process_single_profile
 from aws_costlens.visuals import create_trend_bars
-from aws_costlens.models import ProfileData
+from aws_costlens.models import ProfileData, ReportContext
 
-console = Console(force_terminal=True, legacy_windows=False)
+# Upper bound for concurrent profile workers. Each profile issues many AWS
+# calls of its own, so going much higher mostly trades wall time for
+# throttling errors (Cost Explorer and EC2 Describe* are rate limited per
+# account).
+DEFAULT_MAX_WORKERS = 16
 
+_T = TypeVar("_T")
+_R = TypeVar("_R")
 
-def _generate_timestamped_filename(base_name: str, extension: str) -> str:
+
+def _generate_timestamped_filename(
+    base_name: str, extension: str, context: Optional[ReportContext] = None
+) -> str:
     """Generate a filename with timestamp (like aws-finops-dashboard).
     
     Args:
         base_name: Base name for the file (e.g., "cost-report")
         extension: File extension without dot (e.g., "pdf", "csv", "json")
+        context: Run context whose timestamp is shared by all files of a run
     
     Returns:
         Filename with timestamp: "{base_name}_{YYYYMMDD_HHMM}.{extension}"
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M")
+    timestamp = (context or ReportContext.now()).timestamp
     return f"{base_name}_{timestamp}.{extension}"
 
 
+def _map_concurrently(
+    func: Callable[[_T], _R],
+    items: Iterable[_T],
+    max_workers: Optional[int] = None,
+    description: Optional[str] = None,
+) -> List[_R]:
+    """Run func over items in a thread pool and return results in input order.
+
+    AWS calls are network-bound, so threads overlap their latency. Results
+    are collected before any output is rendered, which keeps Rich tables and
+    panels from interleaving between workers.
+
+    Args:
+        func: Function called once per item
+        items: Items to process (typically profile names)
+        max_workers: Maximum threads (default: DEFAULT_MAX_WORKERS)
+        description: Optional progress bar description
+
+    Returns:
+        List of results, one per item, in the same order as items
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    workers = max(1, min(max_workers or DEFAULT_MAX_WORKERS, len(items)))
+    results: List[Any] = [None] * len(items)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(func, item): idx for idx, item in enumerate(items)}
+        completed = as_completed(futures)
+        progress: Iterable[Future[_R]] = completed
+        if description:
+            progress = track(completed, total=len(futures), description=description)
+        for future in progress:
+            results[futures[future]] = future.result()
+
+    return results
+
+
+def _group_profiles_by_account(
+    profiles_to_use: List[str], max_workers: Optional[int] = None
+) -> Dict[str, List[str]]:
+    """Group profiles by the AWS account they belong to."""
+
+    def _lookup(profile: str) -> Tuple[Optional[str], Optional[str]]:
+        try:
+            return get_account_id(get_session(profile)), None
+        except Exception as e:
+            return None, str(e)
+
+    account_profiles: Dict[str, List[str]] = defaultdict(list)
+    lookups = _map_concurrently(_lookup, profiles_to_use, max_workers)
+    for profile, (account_id, error) in zip(profiles_to_use, lookups):
+        if error:
+            console.log(f"[bold red]Error checking account ID for profile {profile}: {error}[/]")
+        elif account_id:
+            account_profiles[account_id].append(profile)
+        else:
+            console.log(f"[yellow]Could not determine account ID for profile {profile}[/]")
+    return account_profiles
+
+
 def run_dashboard(
     profiles: Optional[List[str]] = None,
     regions: Optional[List[str]] = None,
@@ -77,6 +152,8 @@ def run_dashboard(
     s3_prefix: Optional[str] = None,
     time_range: Optional[Union[int, str]] = None,
     tags: Optional[Dict[str, str]] = None,
+    max_workers: Optional[int] = None,
+    exclude_credits: bool = False,
 ) -> int:
     """
     Run the AWS CostLens application.
@@ -95,7 +172,12 @@ def run_dashboard(
         s3_prefix: Optional S3 path
         time_range: Custom time range
         tags: Tag filters
+        max_workers: Maximum number of profiles processed concurrently
+        exclude_credits: Leave credits and refunds out of the costs
     """
+    # One timestamp for every file written by this run
+    context = ReportContext.now()
+
     # Initialize profiles
     with Status("[bright_cyan]🔄 Connecting to AWS...", spinner="dots12", speed=0.1):
         profiles_to_use = _initialize_profiles(profiles, all_profiles)
@@ -104,12 +186,18 @@ def run_dashboard(
 
     # Run audit report if requested
     if audit:
-        _run_audit_report(profiles_to_use, regions, report_name, report_types, output_dir, s3_bucket, s3_prefix)
+        _run_audit_report(
+            profiles_to_use, regions, report_name, report_types, output_dir, s3_bucket, s3_prefix, max_workers,
+            context,
+        )
         return 0
 
     # Run trend analysis if requested
     if trend:
-        _run_trend_analysis(profiles_to_use, combine, report_name, report_types, output_dir, s3_bucket, s3_prefix, tags)
+        _run_trend_analysis(
+            profiles_to_use, combine, report_name, report_types, output_dir, s3_bucket, s3_prefix, tags, max_workers,
+            context, exclude_credits,
+        )
         return 0
 
     # Run main cost dashboard
@@ -124,6 +212,9 @@ def run_dashboard(
         s3_prefix=s3_prefix,
         time_range=time_range,
         tags=tags,
+        max_workers=max_workers,
+        context=context,
+        exclude_credits=exclude_credits,
     )
     return 0
 
@@ -157,6 +248,98 @@ def _initialize_profiles(profiles: Optional[List[str]], all_profiles: bool) -> L
     return profiles_to_use
 
 
+def _region_blocks(
+    region_map: Dict[str, List[str]], style: Optional[str] = None, sep: str = "\n"
+) -> List[str]:
+    """Format a region -> ids map as one display block per region ("None" if empty)."""
+    blocks = []
+    for region, ids in region_map.items():
+        ids_str = sep.join(ids)
+        blocks.append(f"{region}:\n[{style}]{ids_str}[/]" if style else f"{region}:\n{ids_str}")
+    return blocks or ["None"]
+
+
+def _scan_profile(
+    profile: str, regions: Optional[List[str]]
+) -> Tuple[Tuple[str, ...], Dict[str, Any], Dict[str, Any]]:
+    """Scan a single profile and return its table row, display data and raw data."""
+    session = get_session(profile)
+    account_id = get_account_id(session) or "Unknown"
+    check_regions = regions or get_accessible_regions(session)
+
+    # The scan getters are independent, so run them side by side
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        untagged_future = executor.submit(get_untagged_resources, session, check_regions)
+        stopped_future = executor.submit(get_stopped_instances, session, check_regions)
+        volumes_future = executor.submit(get_unused_volumes, session, check_regions)
+        eips_future = executor.submit(get_unused_eips, session, check_regions)
+        budgets_future = executor.submit(get_budgets, session)
+
+    untagged: Dict[str, Dict[str, List[str]]] = {}
+    try:
+        untagged = untagged_future.result()
+        anomalies = []
+        for service, region_map in untagged.items():
+            if region_map:
+                service_block = f"[bright_yellow]{service}[/]:\n"
+                for region, ids in region_map.items():
+                    if ids:
+                        ids_block = "\n".join(f"[orange1]{res_id}[/]" for res_id in ids)
+                        service_block += f"\n{region}:\n{ids_block}\n"
+                anomalies.append(service_block)
+        anomalies = anomalies or ["None"]
+    except Exception as e:
+        anomalies = [f"Error: {str(e)}"]
+
+    stopped = stopped_future.result()
+    stopped_list = _region_blocks(stopped, style="gold1")
+
+    unused_vols = volumes_future.result()
+    vols_list = _region_blocks(unused_vols, style="dark_orange")
+
+    unused_eips = eips_future.result()
+    eips_list = _region_blocks(unused_eips, sep=",\n")
+
+    budget_data = budgets_future.result()
+    alerts = []
+    for b in budget_data:
+        if b.actual > b.limit:
+            alerts.append(f"[red1]{b.name}[/]: ${b.actual:.2f} > ${b.limit:.2f}")
+    if not alerts:
+        alerts = ["No budgets exceeded"]
+
+    audit_entry = {
+        "profile": profile,
+        "account_id": account_id,
+        "untagged_resources": clean_rich_tags("\n".join(anomalies)),
+        "stopped_instances": clean_rich_tags("\n".join(stopped_list)),
+        "unused_volumes": clean_rich_tags("\n".join(vols_list)),
+        "unused_eips": clean_rich_tags("\n".join(eips_list)),
+        "budget_alerts": clean_rich_tags("\n".join(alerts)),
+    }
+
+    raw_entry = {
+        "profile": profile,
+        "account_id": account_id,
+        "untagged_resources": untagged,
+        "stopped_instances": stopped,
+        "unused_volumes": unused_vols,
+        "unused_eips": unused_eips,
+        "budget_alerts": budget_data,
+    }
+
+    row = (
+        f"[dark_magenta]{profile}[/]",
+        account_id,
+        "\n".join(anomalies),
+        "\n".join(stopped_list),
+        "\n".join(vols_list),
+        "\n".join(eips_list),
+        "\n".join(alerts),
+    )
+    return row, audit_entry, raw_entry
+
+
 def _run_audit_report(
     profiles_to_use: List[str],
     regions: Optional[List[str]],
@@ -165,8 +348,11 @@ def _run_audit_report(
     output_dir: Optional[str],
     s3_bucket: Optional[str],
     s3_prefix: Optional[str],
+    max_workers: Optional[int] = None,
+    context: Optional[ReportContext] = None,
 ) -> None:
     """Generate and export a resource scan report."""
+    context = context or ReportContext.now()
     console.print("[bold bright_green]⚡ Scanning resources...[/]")
     console.print("[dim]Untagged check: EC2, RDS, Lambda, ELBv2[/]")
     console.print("[dim]Also scanning: Stopped instances, Unused volumes, Unused EIPs, Budget alerts (all resources)[/]\n")
@@ -187,76 +373,14 @@ def _run_audit_report(
 
     audit_data = []
     raw_audit_data = []
-    nl = "\n"
-    comma_nl = ",\n"
 
-    for profile in profiles_to_use:
-        session = boto3.Session(profile_name=profile)
-        account_id = get_account_id(session) or "Unknown"
-        check_regions = regions or get_accessible_regions(session)
-
-        try:
-            untagged = get_untagged_resources(session, check_regions)
-            anomalies = []
-            for service, region_map in untagged.items():
-                if region_map:
-                    service_block = f"[bright_yellow]{service}[/]:\n"
-                    for region, ids in region_map.items():
-                        if ids:
-                            ids_block = "\n".join(f"[orange1]{res_id}[/]" for res_id in ids)
-                            service_block += f"\n{region}:\n{ids_block}\n"
-                    anomalies.append(service_block)
-            if not any(region_map for region_map in untagged.values()):
-                anomalies = ["None"]
-        except Exception as e:
-            anomalies = [f"Error: {str(e)}"]
-
-        stopped = get_stopped_instances(session, check_regions)
-        stopped_list = [f"{r}:\n[gold1]{nl.join(ids)}[/]" for r, ids in stopped.items()] or ["None"]
-
-        unused_vols = get_unused_volumes(session, check_regions)
-        vols_list = [f"{r}:\n[dark_orange]{nl.join(ids)}[/]" for r, ids in unused_vols.items()] or ["None"]
-
-        unused_eips = get_unused_eips(session, check_regions)
-        eips_list = [f"{r}:\n{comma_nl.join(ids)}" for r, ids in unused_eips.items()] or ["None"]
-
-        budget_data = get_budgets(session)
-        alerts = []
-        for b in budget_data:
-            if b["actual"] > b["limit"]:
-                alerts.append(f"[red1]{b['name']}[/]: ${b['actual']:.2f} > ${b['limit']:.2f}")
-        if not alerts:
-            alerts = ["No budgets exceeded"]
-
-        audit_data.append({
-            "profile": profile,
-            "account_id": account_id,
-            "untagged_resources": clean_rich_tags("\n".join(anomalies)),
-            "stopped_instances": clean_rich_tags("\n".join(stopped_list)),
-            "unused_volumes": clean_rich_tags("\n".join(vols_list)),
-            "unused_eips": clean_rich_tags("\n".join(eips_list)),
-            "budget_alerts": clean_rich_tags("\n".join(alerts)),
-        })
-
-        raw_audit_data.append({
-            "profile": profile,
-            "account_id": account_id,
-            "untagged_resources": untagged,
-            "stopped_instances": stopped,
-            "unused_volumes": unused_vols,
-            "unused_eips": unused_eips,
-            "budget_alerts": budget_data,
-        })
-
-        table.add_row(
-            f"[dark_magenta]{profile}[/]",
-            account_id,
-            "\n".join(anomalies),
-            "\n".join(stopped_list),
-            "\n".join(vols_list),
-            "\n".join(eips_list),
-            "\n".join(alerts),
-        )
+    results = _map_concurrently(
+        lambda profile: _scan_profile(profile, regions), profiles_to_use, max_workers
+    )
+    for row, audit_entry, raw_entry in results:
+        audit_data.append(audit_entry)
+        raw_audit_data.append(raw_entry)
+        table.add_row(*row)
 
     console.print(table)
     # Note already shown at the start of scan
@@ -272,14 +396,43 @@ def _run_audit_report(
 
         for report_type in report_types:
             if report_type == "csv":
-                csv_content = export_audit_report_to_csv(raw_audit_data)
-                export_handler.save_csv(csv_content, _generate_timestamped_filename(report_name, "csv"))
+                export_handler.save_csv_stream(
+                    iter_audit_rows(raw_audit_data),
+                    _generate_timestamped_filename(report_name, "csv", context),
+                    header=AUDIT_CSV_HEADER,
+                )
             elif report_type == "json":
-                json_content = export_audit_report_to_json(raw_audit_data)
-                export_handler.save_json(json_content, _generate_timestamped_filename(report_name, "json"))
+                export_handler.save_json_stream(
+                    lambda f: export_audit_report_to_json(
+                        raw_audit_data, output_fileobj=f, generated_at=context.generated_at
+                    ),
+                    _generate_timestamped_filename(report_name, "json", context),
+                )
             elif report_type == "pdf":
-                pdf_bytes = export_audit_report_to_pdf(raw_audit_data, report_name)
-                export_handler.save_pdf(pdf_bytes, _generate_timestamped_filename(report_name, "pdf"))
+                export_handler.save_pdf_stream(
+                    lambda f: export_audit_report_to_pdf(
+                        raw_audit_data, report_name, output_fileobj=f, generated_at=context.generated_at
+                    ),
+                    _generate_timestamped_filename(report_name, "pdf", context),
+                )
+            elif report_type == "parquet":
+                try:
+                    export_handler.save_parquet(
+                        lambda f: export_audit_report_to_parquet(raw_audit_data, f),
+                        _generate_timestamped_filename(report_name, "parquet", context),
+                    )
+                except ImportError as e:
+                    console.print(f"[bold red]{str(e)}[/]")
+
+
+def _fetch_trend(
+    profile: str, tags: Optional[Dict[str, str]], exclude_credits: bool = False
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Fetch cost history for a profile, returning (cost_data, error)."""
+    try:
+        return get_trend(get_session(profile), tags, exclude_credits), None
+    except Exception as e:
+        return None, str(e)
 
 
 def _run_trend_analysis(
@@ -291,56 +444,56 @@ def _run_trend_analysis(
     s3_bucket: Optional[str],
     s3_prefix: Optional[str],
     tags: Optional[Dict[str, str]],
+    max_workers: Optional[int] = None,
+    context: Optional[ReportContext] = None,
+    exclude_credits: bool = False,
 ) -> None:
     """Analyze and display cost trends."""
+    context = context or ReportContext.now()
     console.print("[bold bright_magenta]📊 Loading cost history...[/]")
     raw_trend_data = []
 
     if combine:
-        account_profiles = defaultdict(list)
-        for profile in profiles_to_use:
-            try:
-                session = boto3.Session(profile_name=profile)
-                account_id = get_account_id(session)
-                if account_id:
-                    account_profiles[account_id].append(profile)
-            except Exception as e:
-                console.print(f"[red]Error checking account ID for profile {profile}: {str(e)}[/]")
-
-        for account_id, profile_list in account_profiles.items():
-            try:
-                primary_profile = profile_list[0]
-                session = boto3.Session(profile_name=primary_profile)
-                cost_data = get_trend(session, tags)
-                trend_data = cost_data.get("monthly_costs")
-
-                if not trend_data:
-                    console.print(f"[yellow]No trend data available for account {account_id}[/]")
-                    continue
-
-                profiles_str = ", ".join(profile_list)
-                console.print(f"\n[bright_yellow]Account: {account_id} (Profiles: {profiles_str})[/]")
-                raw_trend_data.append(cost_data)
-                create_trend_bars(trend_data)
-            except Exception as e:
-                console.print(f"[red]Error getting trend for account {account_id}: {str(e)}[/]")
+        account_profiles = _group_profiles_by_account(profiles_to_use, max_workers)
+        accounts = list(account_profiles.items())
+        results = _map_concurrently(
+            lambda item: _fetch_trend(item[1][0], tags, exclude_credits), accounts, max_workers
+        )
+
+        for (account_id, profile_list), (cost_data, error) in zip(accounts, results):
+            if error or cost_data is None:
+                console.print(f"[red]Error getting trend for account {account_id}: {error}[/]")
+                continue
+
+            trend_data = cost_data.get("monthly_costs")
+            if not trend_data:
+                console.print(f"[yellow]No trend data available for account {account_id}[/]")
+                continue
+
+            profiles_str = ", ".join(profile_list)
+            console.print(f"\n[bright_yellow]Account: {account_id} (Profiles: {profiles_str})[/]")
+            raw_trend_data.append(cost_data)
+            create_trend_bars(trend_data)
     else:
-        for profile in profiles_to_use:
-            try:
-                session = boto3.Session(profile_name=profile)
-                cost_data = get_trend(session, tags)
-                trend_data = cost_data.get("monthly_costs")
-                account_id = cost_data.get("account_id", "Unknown")
-
-                if not trend_data:
-                    console.print(f"[yellow]No trend data available for profile {profile}[/]")
-                    continue
-
-                console.print(f"\n[bright_yellow]Account: {account_id} (Profile: {profile})[/]")
-                raw_trend_data.append(cost_data)
-                create_trend_bars(trend_data)
-            except Exception as e:
-                console.print(f"[red]Error getting trend for profile {profile}: {str(e)}[/]")
+        results = _map_concurrently(
+            lambda profile: _fetch_trend(profile, tags, exclude_credits), profiles_to_use, max_workers
+        )
+
+        for profile, (cost_data, error) in zip(profiles_to_use, results):
+            if error or cost_data is None:
+                console.print(f"[red]Error getting trend for profile {profile}: {error}[/]")
+                continue
+
+            trend_data = cost_data.get("monthly_costs")
+            account_id = cost_data.get("account_id", "Unknown")
+
+            if not trend_data:
+                console.print(f"[yellow]No trend data available for profile {profile}[/]")
+                continue
+
+            console.print(f"\n[bright_yellow]Account: {account_id} (Profile: {profile})[/]")
+            raw_trend_data.append(cost_data)
+            create_trend_bars(trend_data)
 
     # Export if requested
     if raw_trend_data and report_name and report_types:
@@ -352,30 +505,33 @@ def _run_trend_analysis(
         )
 
         if "json" in report_types:
-            json_content = export_trend_data_to_json(raw_trend_data, report_name)
-            export_handler.save_json(json_content, _generate_timestamped_filename(f"{report_name}_trend", "json"))
+            export_handler.save_json_stream(
+                lambda f: export_trend_data_to_json(
+                    raw_trend_data, report_name, output_fileobj=f, generated_at=context.generated_at
+                ),
+                _generate_timestamped_filename(f"{report_name}_trend", "json", context),
+            )
 
 
 def _get_display_table_period_info(
-    profiles_to_use: List[str], time_range: Optional[Union[int, str]]
+    time_range: Optional[Union[int, str]],
 ) -> Tuple[str, str, str, str]:
-    """Get period information for the display table."""
-    for profile in profiles_to_use:
-        try:
-            sample_session = boto3.Session(profile_name=profile)
-            sample_cost_data = get_cost_data(sample_session, time_range)
-            previous_period_name = sample_cost_data.get("previous_period_name", "Last Month Due")
-            current_period_name = sample_cost_data.get("current_period_name", "Current Month Cost")
-            previous_period_dates = (
-                f"{sample_cost_data['previous_period_start']} to {sample_cost_data['previous_period_end']}"
-            )
-            current_period_dates = (
-                f"{sample_cost_data['current_period_start']} to {sample_cost_data['current_period_end']}"
-            )
-            return (previous_period_name, current_period_name, previous_period_dates, current_period_dates)
-        except Exception:
-            continue
-    return "Last Month Due", "Current Month Cost", "N/A", "N/A"
+    """Get period information for the display table (no AWS calls)."""
+    try:
+        (
+            current_start,
+            current_end,
+            previous_start,
+            previous_end,
+            current_period_name,
+            previous_period_name,
+        ) = resolve_periods(time_range)
+    except ValueError:
+        # Unparseable custom dates; each profile reports the error itself
+        return "Last Month Due", "Current Month Cost", "N/A", "N/A"
+    previous_period_dates = f"{previous_start.date().isoformat()} to {previous_end.date().isoformat()}"
+    current_period_dates = f"{current_start.date().isoformat()} to {current_end.date().isoformat()}"
+    return (previous_period_name, current_period_name, previous_period_dates, current_period_dates)
 
 
 def create_display_table(
@@ -449,6 +605,9 @@ def _run_cost_dashboard(
     s3_prefix: Optional[str],
     time_range: Optional[Union[int, str]],
     tags: Optional[Dict[str, str]],
+    max_workers: Optional[int] = None,
+    context: Optional[ReportContext] = None,
+    exclude_credits: bool = False,
 ) -> None:
     """Run cost dashboard and generate reports."""
     with Status("[bright_cyan]💰 Preparing dashboard...", spinner="dots12", speed=0.1):
@@ -457,48 +616,55 @@ def _run_cost_dashboard(
             current_period_name,
             previous_period_dates,
             current_period_dates,
-        ) = _get_display_table_period_info(profiles_to_use, time_range)
+        ) = _get_display_table_period_info(time_range)
+        context = replace(
+            context or ReportContext.now(),
+            previous_period_name=previous_period_name,
+            current_period_name=current_period_name,
+            previous_period_dates=previous_period_dates,
+            current_period_dates=current_period_dates,
+        )
 
         table = create_display_table(
-            previous_period_dates,
-            current_period_dates,
-            previous_period_name,
-            current_period_name,
+            context.previous_period_dates,
+            context.current_period_dates,
+            context.previous_period_name,
+            context.current_period_name,
         )
 
     export_data: List[ProfileData] = []
 
     if combine:
-        account_profiles = defaultdict(list)
-        for profile in profiles_to_use:
-            try:
-                session = boto3.Session(profile_name=profile)
-                current_account_id = get_account_id(session)
-                if current_account_id:
-                    account_profiles[current_account_id].append(profile)
-                else:
-                    console.log(f"[yellow]Could not determine account ID for profile {profile}[/]")
-            except Exception as e:
-                console.log(f"[bold red]Error checking account ID for profile {profile}: {str(e)}[/]")
-
-        for account_id_key, profile_list in track(
-            account_profiles.items(), description="[bright_cyan]Retrieving AWS costs..."
-        ):
+        account_profiles = _group_profiles_by_account(profiles_to_use, max_workers)
+
+        def _process_account(item: Tuple[str, List[str]]) -> ProfileData:
+            account_id_key, profile_list = item
             if len(profile_list) > 1:
-                profile_data = process_combined_profiles(
-                    account_id_key, profile_list, user_regions, time_range, tags
+                return process_combined_profiles(
+                    account_id_key, profile_list, user_regions, time_range, tags, exclude_credits
                 )
-            else:
-                profile_data = process_single_profile(
-                    profile_list[0], user_regions, time_range, tags
-                )
-            export_data.append(profile_data)
-            add_profile_to_table(table, profile_data)
+            return process_single_profile(
+                profile_list[0], user_regions, time_range, tags, exclude_credits
+            )
+
+        export_data = _map_concurrently(
+            _process_account,
+            account_profiles.items(),
+            max_workers,
+            description="[bright_cyan]Retrieving AWS costs...",
+        )
     else:
-        for profile in track(profiles_to_use, description="[bright_cyan]Retrieving AWS costs..."):
-            profile_data = process_single_profile(profile, user_regions, time_range, tags)
-            export_data.append(profile_data)
-            add_profile_to_table(table, profile_data)
+        export_data = _map_concurrently(
+            lambda profile: process_single_profile(
+                profile, user_regions, time_range, tags, exclude_credits
+            ),
+            profiles_to_use,
+            max_workers,
+            description="[bright_cyan]Retrieving AWS costs...",
+        )
+
+    for profile_data in export_data:
+        add_profile_to_table(table, profile_data)
 
     console.print(table)
 
@@ -513,23 +679,32 @@ def _run_cost_dashboard(
 
         for report_type in report_types:
             if report_type == "csv":
-                csv_content = export_to_csv(export_data, report_name, previous_period_dates, current_period_dates)
-                export_handler.save_csv(csv_content, _generate_timestamped_filename(report_name, "csv"))
+                csv_content = export_to_csv(
+                    export_data, report_name, context.previous_period_dates, context.current_period_dates
+                )
+                export_handler.save_csv(csv_content, _generate_timestamped_filename(report_name, "csv", context))
             elif report_type == "json":
-                json_content = export_to_json(export_data, report_name)
-                export_handler.save_json(json_content, _generate_timestamped_filename(report_name, "json"))
+                json_content = export_to_json(export_data, report_name, generated_at=context.generated_at)
+                export_handler.save_json(json_content, _generate_timestamped_filename(report_name, "json", context))
             elif report_type == "pdf":
-                pdf_bytes = export_cost_dashboard_to_pdf(
-                    export_data, report_name, previous_period_dates, current_period_dates
+                export_handler.save_pdf_stream(
+                    lambda f: export_cost_dashboard_to_pdf(
+                        export_data,
+                        report_name,
+                        context.previous_period_dates,
+                        context.current_period_dates,
+                        output_fileobj=f,
+                        generated_at=context.generated_at,
+                    ),
+                    _generate_timestamped_filename(report_name, "pdf", context),
                 )
-                export_handler.save_pdf(pdf_bytes, _generate_timestamped_filename(report_name, "pdf"))
             elif report_type == "xlsx":
                 xlsx_bytes = export_to_xlsx(
                     export_data,
                     report_name,
-                    previous_period_name,
-                    current_period_name,
-                    previous_period_dates,
-                    current_period_dates,
+                    context.previous_period_name,
+                    context.current_period_name,
+                    context.previous_period_dates,
+                    context.current_period_dates,
                 )
-                export_handler.save_xlsx(xlsx_bytes, _generate_timestamped_filename(report_name, "xlsx"))
+                export_handler.save_xlsx(xlsx_bytes, _generate_timestamped_filename(report_name, "xlsx", context))
@@ -1,17 +1,51 @@
 """AWS API client functions for CostLens."""
 
+import threading
 from collections import defaultdict
-from typing import Dict, Iterable, List, Optional, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar
 
 import boto3
+import jmespath
 from boto3.session import Session
 from botocore.exceptions import ClientError
-from rich.console import Console
 
+from aws_costlens._clients import _cache_disabled, get_client, get_session
+from aws_costlens._regions import home_region
+from aws_costlens.console_setup import console
 from aws_costlens.models import BudgetInfo, EC2Summary, RegionName
 
-# Force UTF-8 and modern Windows terminal mode for Unicode support
-console = Console(force_terminal=True, legacy_windows=False)
+# Maximum concurrent regions per scan call. Regions are independent, but the
+# scan getters themselves also run in parallel, so keep each pool small.
+REGION_MAX_WORKERS = 8
+
+# Largest page sizes EC2 accepts, the default of 100 costs extra round-trips
+INSTANCES_PAGE_SIZE = 1000
+VOLUMES_PAGE_SIZE = 500
+
+# EC2 has no server-side filter for unassociated addresses, so project them here
+_FREE_EIPS = jmespath.compile("Addresses[?AssociationId==null].PublicIp")
+
+# Account id per profile; only successful STS lookups are remembered
+_account_ids: Dict[str, str] = {}
+# One lock per profile, held across the STS call so concurrent cold
+# lookups for the same profile wait for the first instead of repeating it
+_account_id_locks: Dict[str, threading.Lock] = {}
+_account_id_locks_guard = threading.Lock()
+
+_T = TypeVar("_T")
+
+
+def _map_regions(
+    func: Callable[[RegionName], _T], regions: Sequence[RegionName]
+) -> List[Tuple[RegionName, _T]]:
+    """Run func for each region concurrently, returning (region, result) in order."""
+    if len(regions) <= 1:
+        return [(region, func(region)) for region in regions]
+    with ThreadPoolExecutor(
+        max_workers=min(REGION_MAX_WORKERS, len(regions))
+    ) as executor:
+        return list(zip(regions, executor.map(func, regions)))
 
 
 def _chunked(items: Sequence[str], size: int) -> Iterable[List[str]]:
@@ -30,14 +64,43 @@ def get_aws_profiles() -> List[str]:
         return []
 
 
-def get_account_id(session: Session) -> Optional[str]:
-    """Get the AWS account ID for a session."""
+def get_account_id(session: Session, strict: bool = False) -> Optional[str]:
+    """
+    Get the AWS account ID for a session.
+
+    The STS lookup is made once per profile and remembered for the rest of
+    the process (unless COSTLENS_DISABLE_SESSION_CACHE=1).
+
+    Args:
+        session: boto3 Session
+        strict: Re-raise STS errors instead of logging them and returning None
+    """
+    if _cache_disabled():
+        return _lookup_account_id(session, strict)
+
+    profile = session.profile_name
+    with _account_id_locks_guard:
+        lock = _account_id_locks.setdefault(profile, threading.Lock())
+    with lock:
+        cached = _account_ids.get(profile)
+        if cached is not None:
+            return cached
+        account_id = _lookup_account_id(session, strict)
+        if account_id is not None:
+            _account_ids[profile] = account_id
+        return account_id
+
+
+def _lookup_account_id(session: Session, strict: bool) -> Optional[str]:
+    """Ask STS for the session's account ID."""
     try:
-        account_id = session.client("sts").get_caller_identity().get("Account")
-        return str(account_id) if account_id is not None else None
+        account_id = get_client(session, "sts").get_caller_identity().get("Account")
     except Exception as e:
+        if strict:
+            raise
         console.log(f"[yellow]Warning: Could not get account ID: {str(e)}[/]")
         return None
+    return None if account_id is None else str(account_id)
 
 
 def get_all_regions(session: Session) -> List[RegionName]:
@@ -48,7 +111,7 @@ def get_all_regions(session: Session) -> List[RegionName]:
     If the call fails, it will return a hardcoded list of common regions.
     """
     try:
-        ec2_client = session.client("ec2", region_name="us-east-1")
+        ec2_client = get_client(session, "ec2", "us-east-1")
         regions = [
             region["RegionName"] for region in ec2_client.describe_regions()["Regions"]
         ]
@@ -71,17 +134,21 @@ def get_all_regions(session: Session) -> List[RegionName]:
 def get_accessible_regions(session: Session) -> List[RegionName]:
     """Get regions that are accessible with the current credentials."""
     all_regions = get_all_regions(session)
-    accessible_regions = []
 
-    for region in all_regions:
+    def _probe(region: RegionName) -> bool:
         try:
-            ec2_client = session.client("ec2", region_name=region)
+            ec2_client = get_client(session, "ec2", region)
             ec2_client.describe_instances(MaxResults=5)
-            accessible_regions.append(region)
+            return True
         except Exception:
             console.log(
                 f"[yellow]Region {region} is not accessible with the current credentials[/]"
             )
+            return False
+
+    accessible_regions = [
+        region for region, accessible in _map_regions(_probe, all_regions) if accessible
+    ]
 
     if not accessible_regions:
         console.log("[yellow]No accessible regions found. Using default regions.[/]")
@@ -111,13 +178,13 @@ def ec2_summary(
 
     for region in regions:
         try:
-            ec2_regional = session.client("ec2", region_name=region)
+            ec2_regional = get_client(session, "ec2", region)
             paginator = ec2_regional.get_paginator("describe_instances")
-            for page in paginator.paginate():
-                for reservation in page.get("Reservations", []):
-                    for instance in reservation.get("Instances", []):
-                        state = instance["State"]["Name"]
-                        instance_summary[state] += 1
+            pages = paginator.paginate(
+                PaginationConfig={"PageSize": INSTANCES_PAGE_SIZE}
+            )
+            for state in pages.search("Reservations[].Instances[].State.Name"):
+                instance_summary[state] += 1
         except Exception as e:
             console.log(
                 f"[yellow]Warning: Could not access EC2 in region {region}: {str(e)}[/]"
@@ -138,82 +205,76 @@ def get_stopped_instances(
     session: Session, regions: List[RegionName]
 ) -> Dict[RegionName, List[str]]:
     """Get stopped EC2 instances per region."""
-    stopped = {}
-    for region in regions:
+
+    def _scan_region(region: RegionName) -> List[str]:
+        ids: List[str] = []
         try:
-            ec2 = session.client("ec2", region_name=region)
+            ec2 = get_client(session, "ec2", region)
             paginator = ec2.get_paginator("describe_instances")
-            ids = []
-            for page in paginator.paginate(
-                Filters=[{"Name": "instance-state-name", "Values": ["stopped"]}]
-            ):
-                ids.extend(
-                    inst["InstanceId"]
-                    for res in page.get("Reservations", [])
-                    for inst in res.get("Instances", [])
-                )
-            if ids:
-                stopped[region] = ids
+            pages = paginator.paginate(
+                Filters=[{"Name": "instance-state-name", "Values": ["stopped"]}],
+                PaginationConfig={"PageSize": INSTANCES_PAGE_SIZE},
+            )
+            ids.extend(pages.search("Reservations[].Instances[].InstanceId"))
         except Exception as e:
             console.log(
                 f"[yellow]Warning: Could not fetch stopped instances in {region}: {str(e)}[/]"
             )
-    return stopped
+        return ids
+
+    return {region: ids for region, ids in _map_regions(_scan_region, regions) if ids}
 
 
 def get_unused_volumes(
     session: Session, regions: List[RegionName]
 ) -> Dict[RegionName, List[str]]:
     """Get unattached EBS volumes per region."""
-    unused = {}
-    for region in regions:
+
+    def _scan_region(region: RegionName) -> List[str]:
+        vols: List[str] = []
         try:
-            ec2 = session.client("ec2", region_name=region)
+            ec2 = get_client(session, "ec2", region)
             paginator = ec2.get_paginator("describe_volumes")
-            vols = []
-            for page in paginator.paginate(
-                Filters=[{"Name": "status", "Values": ["available"]}]
-            ):
-                vols.extend(vol["VolumeId"] for vol in page.get("Volumes", []))
-            if vols:
-                unused[region] = vols
+            pages = paginator.paginate(
+                Filters=[{"Name": "status", "Values": ["available"]}],
+                PaginationConfig={"PageSize": VOLUMES_PAGE_SIZE},
+            )
+            vols.extend(pages.search("Volumes[].VolumeId"))
         except Exception as e:
             console.log(
                 f"[yellow]Warning: Could not fetch unused volumes in {region}: {str(e)}[/]"
             )
-    return unused
+        return vols
+
+    return {
+        region: vols for region, vols in _map_regions(_scan_region, regions) if vols
+    }
 
 
 def get_unused_eips(
     session: Session, regions: List[RegionName]
 ) -> Dict[RegionName, List[str]]:
     """Get unused Elastic IPs per region."""
-    eips = {}
-    for region in regions:
+
+    def _scan_region(region: RegionName) -> List[str]:
+        free: List[str] = []
         try:
-            ec2 = session.client("ec2", region_name=region)
-            free = []
+            ec2 = get_client(session, "ec2", region)
             response = ec2.describe_addresses()
-            free.extend(
-                addr["PublicIp"]
-                for addr in response.get("Addresses", [])
-                if not addr.get("AssociationId")
-            )
+            free.extend(_FREE_EIPS.search(response) or [])
             # Handle manual pagination if NextToken is present
             while response.get("NextToken"):
                 response = ec2.describe_addresses(NextToken=response["NextToken"])
-                free.extend(
-                    addr["PublicIp"]
-                    for addr in response.get("Addresses", [])
-                    if not addr.get("AssociationId")
-                )
-            if free:
-                eips[region] = free
+                free.extend(_FREE_EIPS.search(response) or [])
         except Exception as e:
             console.log(
                 f"[yellow]Warning: Could not fetch EIPs in {region}: {str(e)}[/]"
             )
-    return eips
+        return free
+
+    return {
+        region: free for region, free in _map_regions(_scan_region, regions) if free
+    }
 
 
 def get_untagged_resources(
@@ -227,18 +288,18 @@ def get_untagged_resources(
         "ELBv2": {},
     }
 
-    for region in regions:
+    def _scan_region(region: str) -> Dict[str, List[str]]:
+        found: Dict[str, List[str]] = {}
+
         # EC2
         try:
-            ec2 = session.client("ec2", region_name=region)
+            ec2 = get_client(session, "ec2", region)
             paginator = ec2.get_paginator("describe_instances")
             for page in paginator.paginate():
                 for reservation in page.get("Reservations", []):
                     for instance in reservation.get("Instances", []):
                         if not instance.get("Tags"):
-                            result["EC2"].setdefault(region, []).append(
-                                instance["InstanceId"]
-                            )
+                            found.setdefault("EC2", []).append(instance["InstanceId"])
         except Exception as e:
             console.log(
                 f"[yellow]Warning: Could not fetch EC2 instances in {region}: {str(e)}[/]"
@@ -246,7 +307,7 @@ def get_untagged_resources(
 
         # RDS
         try:
-            rds = session.client("rds", region_name=region)
+            rds = get_client(session, "rds", region)
             paginator = rds.get_paginator("describe_db_instances")
             for page in paginator.paginate():
                 for db_instance in page.get("DBInstances", []):
@@ -255,7 +316,7 @@ def get_untagged_resources(
                         "TagList", []
                     )
                     if not tags:
-                        result["RDS"].setdefault(region, []).append(
+                        found.setdefault("RDS", []).append(
                             db_instance["DBInstanceIdentifier"]
                         )
         except Exception as e:
@@ -265,16 +326,14 @@ def get_untagged_resources(
 
         # Lambda
         try:
-            lambda_client = session.client("lambda", region_name=region)
+            lambda_client = get_client(session, "lambda", region)
             paginator = lambda_client.get_paginator("list_functions")
             for page in paginator.paginate():
                 for function in page.get("Functions", []):
                     arn = function["FunctionArn"]
                     tags = lambda_client.list_tags(Resource=arn).get("Tags", {})
                     if not tags:
-                        result["Lambda"].setdefault(region, []).append(
-                            function["FunctionName"]
-                        )
+                        found.setdefault("Lambda", []).append(function["FunctionName"])
         except Exception as e:
             console.log(
                 f"[yellow]Warning: Could not fetch Lambda functions in {region}: {str(e)}[/]"
@@ -282,7 +341,7 @@ def get_untagged_resources(
 
         # ELBv2
         try:
-            elbv2 = session.client("elbv2", region_name=region)
+            elbv2 = get_client(session, "elbv2", region)
             lbs = []
             paginator = elbv2.get_paginator("describe_load_balancers")
             for page in paginator.paginate():
@@ -299,19 +358,25 @@ def get_untagged_resources(
                         arn = desc["ResourceArn"]
                         if not desc.get("Tags"):
                             lb_name = arn_to_name.get(arn, arn)
-                            result["ELBv2"].setdefault(region, []).append(lb_name)
+                            found.setdefault("ELBv2", []).append(lb_name)
         except Exception as e:
             console.log(
                 f"[yellow]Warning: Could not fetch ELBv2 load balancers in {region}: {str(e)}[/]"
             )
 
+        return found
+
+    for region, found in _map_regions(_scan_region, regions):
+        for service, ids in found.items():
+            result[service][region] = ids
+
     return result
 
 
 def get_budgets(session: Session) -> List[BudgetInfo]:
     """Get AWS Budgets for the account."""
     account_id = get_account_id(session)
-    budgets = session.client("budgets", region_name="us-east-1")
+    budgets = get_client(session, "budgets", home_region("budgets"))
 
     budgets_data: List[BudgetInfo] = []
     try:
@@ -319,19 +384,19 @@ def get_budgets(session: Session) -> List[BudgetInfo]:
         for page in paginator.paginate(AccountId=account_id):
             for budget in page.get("Budgets", []):
                 budgets_data.append(
-                    {
-                        "name": budget["BudgetName"],
-                        "limit": float(budget["BudgetLimit"]["Amount"]),
-                        "actual": float(
+                    BudgetInfo(
+                        name=budget["BudgetName"],
+                        limit=float(budget["BudgetLimit"]["Amount"]),
+                        actual=float(
                             budget["CalculatedSpend"]["ActualSpend"]["Amount"]
                         ),
-                        "forecast": float(
+                        forecast=float(
                             budget["CalculatedSpend"]
                             .get("ForecastedSpend", {})
                             .get("Amount", 0.0)
                         )
                         or None,
-                    }
+                    )
                 )
     except Exception as e:
         pass
@@ -1,22 +1,18 @@
 """CLI commands entry point for AWS CostLens."""
 
 import argparse
+import os
 import sys
 from typing import Dict, List, Optional
 
 # Setup UTF-8 console for Windows
-from aws_costlens.console_setup import setup_console
+from aws_costlens.console_setup import console, setup_console
 setup_console()
 
-from rich.console import Console
-
 from aws_costlens import __version__
 from aws_costlens.app_controller import run_dashboard
 from aws_costlens.common_utils import load_config_file
 
-# Force UTF-8 and modern Windows terminal mode for Unicode support
-console = Console(force_terminal=True, legacy_windows=False)
-
 
 def welcome_banner() -> None:
     """Display the welcome banner with version."""
@@ -86,6 +82,11 @@ Examples:
         "--config", "-c",
         help="Path to YAML config file",
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        help="Maximum number of profiles processed in parallel (default: 16)",
+    )
     parser.add_argument(
         "--merge",
         action="store_true",
@@ -100,6 +101,16 @@ Examples:
         action="append",
         help="Filter by tag (key=value), can be used multiple times",
     )
+    parser.add_argument(
+        "--exclude-credits",
+        action="store_true",
+        help="Exclude credits and refunds from costs",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query Cost Explorer instead of reusing cached responses",
+    )
 
     # Subcommands
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
@@ -125,6 +136,16 @@ Examples:
             "--config", "-c",
             help="Path to YAML config file",
         )
+        subparser.add_argument(
+            "--max-workers",
+            type=int,
+            help="Maximum number of profiles processed in parallel (default: 16)",
+        )
+        subparser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="Always query Cost Explorer instead of reusing cached responses",
+        )
 
     # Cost command
     cost_parser = subparsers.add_parser("cost", help="Display cost dashboard")
@@ -143,6 +164,11 @@ Examples:
         action="append",
         help="Filter by tag (key=value), can be used multiple times",
     )
+    cost_parser.add_argument(
+        "--exclude-credits",
+        action="store_true",
+        help="Exclude credits and refunds from costs",
+    )
 
     # History command (formerly trend)
     history_parser = subparsers.add_parser("history", help="Display 6-month cost history")
@@ -172,8 +198,8 @@ Examples:
     scan_parser.add_argument(
         "--format", "-f",
         nargs="+",
-        choices=["pdf", "csv", "json"],
-        help="Export format(s): pdf, csv, json, xlsx",
+        choices=["pdf", "csv", "json", "parquet"],
+        help="Export format(s): pdf, csv, json, parquet",
     )
     scan_parser.add_argument(
         "--dir", "-d",
@@ -197,6 +223,11 @@ Examples:
         action="append",
         help="Filter by tag (key=value)",
     )
+    export_parser.add_argument(
+        "--exclude-credits",
+        action="store_true",
+        help="Exclude credits and refunds from costs",
+    )
     export_parser.add_argument(
         "--name", "-n",
         default="costlens_report",
@@ -270,6 +301,12 @@ Examples:
     profiles = args.profiles or config.get("profiles")
     regions = args.regions or config.get("regions")
     all_profiles = args.all_profiles or config.get("all_profiles", False)
+    max_workers = args.max_workers or config.get("max_workers")
+    exclude_credits = getattr(args, "exclude_credits", False) or config.get("exclude_credits", False)
+
+    # Read by the Cost Explorer response cache (aws_costlens._ce_cache)
+    if args.no_cache or config.get("no_cache", False):
+        os.environ["COSTLENS_DISABLE_CE_CACHE"] = "1"
 
     # Parse time range
     time_range = None
@@ -308,9 +345,11 @@ Examples:
             profiles=profiles,
             regions=regions,
             all_profiles=all_profiles,
+            max_workers=max_workers,
             combine=args.merge,
             time_range=time_range,
             tags=tags,
+            exclude_credits=exclude_credits,
         )
 
     elif args.command == "history":
@@ -318,6 +357,7 @@ Examples:
             profiles=profiles,
             regions=regions,
             all_profiles=all_profiles,
+            max_workers=max_workers,
             trend=True,
             report_name=args.name,
             report_types=args.format,
@@ -329,6 +369,7 @@ Examples:
             profiles=profiles,
             regions=regions,
             all_profiles=all_profiles,
+            max_workers=max_workers,
             audit=True,
             report_name=args.name,
             report_types=args.format,
@@ -340,6 +381,7 @@ Examples:
             profiles=profiles,
             regions=regions,
             all_profiles=all_profiles,
+            max_workers=max_workers,
             combine=getattr(args, "merge", False),
             audit=getattr(args, "scan", False),
             trend=getattr(args, "history", False),
@@ -350,6 +392,7 @@ Examples:
             s3_prefix=args.s3_path,
             time_range=time_range,
             tags=tags,
+            exclude_credits=exclude_credits,
         )
 
 
@@ -1,39 +1,51 @@
 """Common utility functions for AWS CostLens - YAML config only."""
 
+import copy
+import csv
 import json
 import os
 import re
+from dataclasses import asdict, is_dataclass
 from datetime import datetime
-from io import BytesIO
-from typing import Any, Dict, List, Optional, Tuple
-
-import yaml
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter, portrait
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-from rich.console import Console
-
-from aws_costlens.pdf_renderer import (
-    bulletList,
-    footerParagraph,
-    formatServicesForList,
-    keyValueTable,
-    miniHeader,
-    paragraphStyling,
-    profileHeaderCard,
-    split_to_items,
-)
+from functools import lru_cache
+from io import BytesIO, StringIO, TextIOWrapper
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, TextIO, Tuple, Union
+
+from aws_costlens.console_setup import console, emit
+
+# orjson is a dependency and serializes straight to bytes several times
+# faster; the stdlib fallback covers installs where it is missing
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Rich markup tags such as [bold red] or [/]
+_RICH_TAG_RE = re.compile(r"\[/?[^\]]+\]")
 
-# Force UTF-8 and modern Windows terminal mode for Unicode support
-console = Console(force_terminal=True, legacy_windows=False)
+
+@lru_cache(maxsize=32)
+def _load_yaml_cached(abspath: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a YAML file once per (path, mtime, size); the stat fields key the cache."""
+    import yaml
+
+    # Prefer the libyaml-backed loader, it parses in C
+    loader = getattr(yaml, "CSafeLoader", None)
+    if loader is None:
+        console.print("[dim]libyaml not available, using the pure-Python YAML loader[/]")
+        loader = yaml.SafeLoader
+
+    with open(abspath, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=loader) or {}
 
 
 def load_config_file(config_path: str) -> Dict[str, Any]:
     """
     Load configuration from a YAML file.
 
+    Parsed files are cached until their mtime or size changes; each call
+    returns a fresh copy so callers may mutate it.
+
     Args:
         config_path: Path to config file (.yaml or .yml)
 
@@ -45,22 +57,132 @@ def load_config_file(config_path: str) -> Dict[str, Any]:
         return {}
 
     ext = os.path.splitext(config_path)[1].lower()
+    if ext not in (".yaml", ".yml"):
+        console.print(f"[bold red]Unsupported config format: {ext}. Use .yaml or .yml[/]")
+        return {}
 
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            if ext in (".yaml", ".yml"):
-                return yaml.safe_load(f) or {}
-            else:
-                console.print(f"[bold red]Unsupported config format: {ext}. Use .yaml or .yml[/]")
-                return {}
+        st = os.stat(config_path)
+        config = _load_yaml_cached(os.path.abspath(config_path), st.st_mtime_ns, st.st_size)
+        return copy.deepcopy(config)
     except Exception as e:
         console.print(f"[bold red]Error loading config: {str(e)}[/]")
         return {}
 
 
+def _json_default(obj: Any) -> Any:
+    """Serialize values the stdlib json module does not handle."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def to_json_bytes(obj: Any, pretty: bool = True) -> bytes:
+    """Serialize obj to UTF-8 JSON, using orjson when installed.
+
+    Non-ASCII text is written as raw UTF-8 on both paths (orjson has no
+    escaping option, so the stdlib encoder runs with ensure_ascii=False).
+
+    Args:
+        obj: Value to serialize
+        pretty: Indent by two spaces; compact separators otherwise
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default).encode("utf-8")
+    return json.dumps(
+        obj, separators=(",", ":"), ensure_ascii=False, default=_json_default
+    ).encode("utf-8")
+
+
+def write_json(obj: Any, fileobj: BinaryIO, pretty: bool = True) -> None:
+    """Serialize obj as UTF-8 JSON straight into a binary file object.
+
+    The stdlib encoder streams its chunks through the file buffer instead of
+    joining the whole document into one string first. orjson has no streaming
+    API, so its bytes are written in a single call. Non-ASCII text is
+    written as raw UTF-8, as in to_json_bytes.
+
+    Args:
+        obj: Value to serialize
+        fileobj: Binary file object to write to
+        pretty: Indent by two spaces; compact separators otherwise
+    """
+    if orjson is not None:
+        fileobj.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0))
+        return
+    text = TextIOWrapper(fileobj, encoding="utf-8")
+    try:
+        if pretty:
+            json.dump(obj, text, indent=2, ensure_ascii=False, default=_json_default)
+        else:
+            json.dump(
+                obj, text, separators=(",", ":"), ensure_ascii=False, default=_json_default
+            )
+        text.flush()
+    finally:
+        # Hand the underlying file back to the caller instead of closing it
+        text.detach()
+
+
 def clean_rich_tags(text: str) -> str:
     """Remove Rich library formatting tags from text."""
-    return re.sub(r"\[/?[^\]]+\]", "", text)
+    return _RICH_TAG_RE.sub("", text)
+
+
+def clean_rich_tags_many(texts: List[str]) -> List[str]:
+    """Remove Rich library formatting tags from each text in a list."""
+    sub = _RICH_TAG_RE.sub
+    return [sub("", text) for text in texts]
+
+
+def _export_pdf(
+    build_story: Callable[[float], List],
+    output_path: Optional[str] = None,
+    output_fileobj: Optional[BinaryIO] = None,
+) -> Optional[bytes]:
+    """
+    Lay out a report story on the CostLens page template.
+
+    Args:
+        build_story: Called with the frame width, returns the flowables
+        output_path: Build the PDF straight into this file
+        output_fileobj: Build the PDF into this binary file object
+
+    Returns:
+        None for output_fileobj, b"" for output_path, otherwise the PDF bytes
+    """
+    from reportlab.lib.pagesizes import letter, portrait
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate
+
+    def _build(target: BinaryIO) -> None:
+        doc = SimpleDocTemplate(
+            target,
+            pagesize=portrait(letter),
+            rightMargin=0.5 * inch,
+            leftMargin=0.5 * inch,
+            topMargin=0.5 * inch,
+            bottomMargin=0.5 * inch,
+            allowSplitting=True,
+        )
+        doc.build(build_story(doc.width))
+
+    if output_fileobj is not None:
+        _build(output_fileobj)
+        return None
+
+    if output_path:
+        with open(output_path, "wb") as f:
+            _build(f)
+        return b""
+
+    buffer = BytesIO()
+    _build(buffer)
+    return buffer.getvalue()
 
 
 def export_cost_dashboard_to_pdf(
@@ -69,7 +191,9 @@ def export_cost_dashboard_to_pdf(
     previous_period_dates: str,
     current_period_dates: str,
     output_path: Optional[str] = None,
-) -> bytes:
+    output_fileobj: Optional[BinaryIO] = None,
+    generated_at: Optional[datetime] = None,
+) -> Optional[bytes]:
     """
     Export cost dashboard to PDF format with improved styling.
 
@@ -79,175 +203,51 @@ def export_cost_dashboard_to_pdf(
         previous_period_dates: Previous period date range
         current_period_dates: Current period date range
         output_path: Optional path to save PDF
+        output_fileobj: Optional binary file object to build the PDF into
+        generated_at: Report time shown in the footer (defaults to now)
 
     Returns:
-        PDF content as bytes
+        PDF content as bytes, b"" when written to output_path, or None when
+        written to output_fileobj
     """
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(
-        buffer,
-        pagesize=portrait(letter),
-        rightMargin=0.5 * inch,
-        leftMargin=0.5 * inch,
-        topMargin=0.5 * inch,
-        bottomMargin=0.5 * inch,
-        allowSplitting=True,
+    from reportlab.platypus import Paragraph, Spacer
+
+    from aws_costlens.pdf_renderer import (
+        cost_profile_story,
+        footerParagraph,
+        paragraphStyling,
+        profile_separator,
+        styles,
     )
-    styles = getSampleStyleSheet()
-    story = []
-
-    # Main Title
-    story.append(Paragraph("AWS CostLens (Cost Report)", styles["Title"]))
-    story.append(Spacer(1, 10))
-
-    def _profile_separator() -> Table:
-        separator = Table(
-            [[" "]],
-            colWidths=[doc.width],
-            hAlign="LEFT",
-        )
-        separator.setStyle(TableStyle([
-            ("LINEBELOW", (0, 0), (-1, -1), 0.75, colors.HexColor("#BFBFBF")),
-        ]))
-        return separator
-
-    # Period dates header
-    story.append(paragraphStyling(
-        f"<b>Previous Period:</b> {previous_period_dates}<br/>"
-        f"<b>Current Period:</b> {current_period_dates}"
-    ))
-    story.append(Spacer(1, 6))
-
-    for idx, profile_data in enumerate(export_data):
-        # Header card per profile
-        profile = profile_data.get("profile", "N/A")
-        account_id = profile_data.get("account_id", "N/A")
-        story.append(profileHeaderCard(profile, account_id, doc.width))
-        story.append(Spacer(1, 6))
-
-        # Cost summary with percentage change
-        pct = profile_data.get("percent_change_in_total_cost")
-        pct_str = f" ({pct:+.1f}%)" if pct is not None else ""
-        kv_rows = [
-            ("Previous Period Cost", f"<b>${profile_data.get('last_month', 0):,.2f}</b>"),
-            ("Current Period Cost", f"<b>${profile_data.get('current_month', 0):,.2f}</b>{pct_str}"),
-        ]
-        story.append(keyValueTable(kv_rows))
-        story.append(Spacer(1, 6))
-
-        # Service comparison table
-        story.append(miniHeader("Service Cost Comparison"))
-
-        prev_services = profile_data.get("previous_service_costs", [])
-        curr_services = profile_data.get("service_costs", [])
-
-        prev_map = {svc: cost for svc, cost in prev_services}
-        curr_map = {svc: cost for svc, cost in curr_services}
-        services = sorted(set(prev_map) | set(curr_map), key=lambda s: curr_map.get(s, 0), reverse=True)
-
-        table_rows = [
-            [
-                paragraphStyling("<b>Service</b>"),
-                paragraphStyling("<b>Previous</b>"),
-                paragraphStyling("<b>Current</b>"),
-                paragraphStyling("<b>Diff</b>"),
-                paragraphStyling("<b>Diff %</b>"),
-            ]
+
+    def _story(width: float) -> List:
+        story = [
+            # Main Title
+            Paragraph("AWS CostLens (Cost Report)", styles["Title"]),
+            Spacer(1, 10),
+            # Period dates header
+            paragraphStyling(
+                f"<b>Previous Period:</b> {previous_period_dates}<br/>"
+                f"<b>Current Period:</b> {current_period_dates}"
+            ),
+            Spacer(1, 6),
         ]
 
-        # Total row
-        prev_total = float(profile_data.get("last_month", 0))
-        curr_total = float(profile_data.get("current_month", 0))
-        total_diff = curr_total - prev_total
-        total_pct = (total_diff / prev_total * 100.0) if abs(prev_total) > 0.0001 else None
-        table_rows.append([
-            paragraphStyling("<b>Total costs</b>"),
-            paragraphStyling(f"<b>${prev_total:,.2f}</b>"),
-            paragraphStyling(f"<b>${curr_total:,.2f}</b>"),
-            paragraphStyling(f"<b>${total_diff:,.2f}</b>"),
-            paragraphStyling(f"<b>{total_pct:+.2f}%</b>" if total_pct is not None else "<b>N/A</b>"),
-        ])
-
-        for svc in services:
-            prev_cost = float(prev_map.get(svc, 0.0))
-            curr_cost = float(curr_map.get(svc, 0.0))
-            if prev_cost < 0.0001 and curr_cost < 0.0001:
-                continue
-            diff = curr_cost - prev_cost
-            diff_pct = (diff / prev_cost * 100.0) if abs(prev_cost) > 0.0001 else None
-            table_rows.append([
-                paragraphStyling(svc),
-                paragraphStyling(f"${prev_cost:,.2f}"),
-                paragraphStyling(f"${curr_cost:,.2f}"),
-                paragraphStyling(f"${diff:,.2f}"),
-                paragraphStyling(f"{diff_pct:+.2f}%" if diff_pct is not None else "N/A"),
-            ])
-
-        service_table = Table(
-            table_rows,
-            colWidths=[2.8 * inch, 1.2 * inch, 1.2 * inch, 1.2 * inch, 1.1 * inch],
-            hAlign="LEFT",
-        )
-        service_table.setStyle(TableStyle([
-            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#D9E1F2")),
-            ("GRID", (0, 0), (-1, -1), 0.25, colors.HexColor("#CCCCCC")),
-            ("VALIGN", (0, 0), (-1, -1), "TOP"),
-            ("LEFTPADDING", (0, 0), (-1, -1), 4),
-            ("RIGHTPADDING", (0, 0), (-1, -1), 4),
-            ("TOPPADDING", (0, 0), (-1, -1), 2),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
-        ]))
-        story.append(service_table)
-        story.append(Spacer(1, 8))
+        for idx, profile_data in enumerate(export_data):
+            # Add spacing between profiles (not page break for better flow)
+            if idx:
+                story.extend([Spacer(1, 8), profile_separator(width), Spacer(1, 10)])
+            story.extend(cost_profile_story(profile_data, width))
 
-        # Budgets and EC2 side-by-side
-        budgets = [clean_rich_tags(b) for b in profile_data.get("budget_info", ["No budgets configured"])]
-        ec2_summary = profile_data.get("ec2_summary", {})
-        ec2_items = [
-            f"{state}: {count}"
-            for state, count in ec2_summary.items()
-            if count > 0
-        ] or ["No instances"]
-
-        info_table = Table(
-            [
-                [paragraphStyling("<b>Budgets</b>"), paragraphStyling("<b>EC2 Summary</b>")],
-                [bulletList(budgets), bulletList(ec2_items)],
-            ],
-            colWidths=[doc.width / 2, doc.width / 2],
-            hAlign="LEFT",
-        )
-        info_table.setStyle(TableStyle([
-            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#F2F2F2")),
-            ("GRID", (0, 0), (-1, -1), 0.25, colors.HexColor("#CCCCCC")),
-            ("VALIGN", (0, 0), (-1, -1), "TOP"),
-            ("LEFTPADDING", (0, 0), (-1, -1), 6),
-            ("RIGHTPADDING", (0, 0), (-1, -1), 6),
-            ("TOPPADDING", (0, 0), (-1, -1), 4),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-        ]))
-        story.append(info_table)
-
-        # Add spacing between profiles (not page break for better flow)
-        if idx < len(export_data) - 1:
-            story.append(Spacer(1, 8))
-            story.append(_profile_separator())
-            story.append(Spacer(1, 10))
-
-    # Footer
-    story.append(Spacer(1, 8))
-    footer_text = f"Generated by AWS CostLens on {datetime.now():%Y-%m-%d %H:%M:%S}"
-    story.append(footerParagraph(footer_text))
-
-    # Build PDF
-    doc.build(story)
-    buffer.seek(0)
-    pdf_bytes = buffer.read()
+        # Footer
+        story.append(Spacer(1, 8))
+        footer_text = f"Generated by AWS CostLens on {generated_at or datetime.now():%Y-%m-%d %H:%M:%S}"
+        story.append(footerParagraph(footer_text))
+        return story
 
-    if output_path:
-        with open(output_path, "wb") as f:
-            f.write(pdf_bytes)
-        console.print(f"[green]✓ PDF saved to {output_path}[/]")
+    pdf_bytes = _export_pdf(_story, output_path, output_fileobj)
+    if output_path and output_fileobj is None:
+        emit(f"✓ PDF saved to {output_path}", "green")
 
     return pdf_bytes
 
@@ -256,7 +256,9 @@ def export_audit_report_to_pdf(
     audit_data: List[Dict],
     report_name: str,
     output_path: Optional[str] = None,
-) -> bytes:
+    output_fileobj: Optional[BinaryIO] = None,
+    generated_at: Optional[datetime] = None,
+) -> Optional[bytes]:
     """
     Export audit/scan report to PDF with improved styling.
 
@@ -264,277 +266,78 @@ def export_audit_report_to_pdf(
         audit_data: List of audit data dictionaries
         report_name: Report name
         output_path: Optional save path
+        output_fileobj: Optional binary file object to build the PDF into
+        generated_at: Report time shown in the footer (defaults to now)
 
     Returns:
-        PDF bytes
+        PDF bytes, b"" when written to output_path, or None when written to
+        output_fileobj
     """
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(
-        buffer,
-        pagesize=portrait(letter),
-        rightMargin=0.5 * inch,
-        leftMargin=0.5 * inch,
-        topMargin=0.5 * inch,
-        bottomMargin=0.5 * inch,
-        allowSplitting=True,
-    )
-    styles = getSampleStyleSheet()
-    story = []
-
-    # Main Title
-    story.append(Paragraph("AWS CostLens (Scan Report)", styles["Title"]))
-    story.append(Spacer(1, 8))
-
-    def _profile_separator() -> Table:
-        separator = Table(
-            [[" "]],
-            colWidths=[doc.width],
-            hAlign="LEFT",
-        )
-        separator.setStyle(TableStyle([
-            ("LINEBELOW", (0, 0), (-1, -1), 0.75, colors.HexColor("#BFBFBF")),
-        ]))
-        return separator
-
-    def _region_header(text: str) -> Table:
-        header = Table(
-            [[paragraphStyling(f"<b>{text}</b>")]],
-            colWidths=[doc.width],
-            hAlign="LEFT",
-        )
-        header.setStyle(TableStyle([
-            ("BACKGROUND", (0, 0), (-1, -1), colors.HexColor("#F2F2F2")),
-            ("LEFTPADDING", (0, 0), (-1, -1), 4),
-            ("RIGHTPADDING", (0, 0), (-1, -1), 4),
-            ("TOPPADDING", (0, 0), (-1, -1), 2),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
-        ]))
-        return header
-
-    def _chunk_rows(items: List[str], columns: int) -> List[List[str]]:
-        rows = []
-        row = []
-        for item in items:
-            row.append(item)
-            if len(row) == columns:
-                rows.append(row)
-                row = []
-        if row:
-            row.extend([""] * (columns - len(row)))
-            rows.append(row)
-        return rows or [["None"] + [""] * (columns - 1)]
-
-    def _render_region_items(title: str, region_map: Dict[str, List[str]], columns: int = 3) -> None:
-        if title:
-            story.append(miniHeader(title))
-        if not region_map:
-            story.append(paragraphStyling("None found"))
-            story.append(Spacer(1, 6))
-            return
-
-        for region in sorted(region_map.keys()):
-            items = region_map.get(region, []) or []
-            story.append(_region_header(f"{region}:"))
-            table_rows = _chunk_rows(items, columns)
-            table = Table(
-                table_rows,
-                colWidths=[doc.width / columns] * columns,
-                hAlign="LEFT",
-            )
-            table.setStyle(TableStyle([
-                ("GRID", (0, 0), (-1, -1), 0.25, colors.HexColor("#CCCCCC")),
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ("LEFTPADDING", (0, 0), (-1, -1), 4),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 4),
-                ("TOPPADDING", (0, 0), (-1, -1), 2),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
-            ]))
-            story.append(table)
-            story.append(Spacer(1, 4))
-        story.append(Spacer(1, 6))
-
-    def _render_region_items_wrapped(title: str, region_map: Dict[str, List[str]], columns: int = 2) -> None:
-        if title:
-            story.append(miniHeader(title))
-        if not region_map:
-            story.append(paragraphStyling("None found"))
-            story.append(Spacer(1, 6))
-            return
-
-        for region in sorted(region_map.keys()):
-            items = region_map.get(region, []) or []
-            story.append(_region_header(f"{region}:"))
-            if not items:
-                story.append(paragraphStyling("None found"))
-                story.append(Spacer(1, 4))
-                continue
-
-            row_items = _chunk_rows(items, columns)
-            table_rows = [
-                [paragraphStyling(item) if item else paragraphStyling("") for item in row]
-                for row in row_items
-            ]
-            table = Table(
-                table_rows,
-                colWidths=[doc.width / columns] * columns,
-                hAlign="LEFT",
-            )
-            table.setStyle(TableStyle([
-                ("GRID", (0, 0), (-1, -1), 0.25, colors.HexColor("#CCCCCC")),
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ("LEFTPADDING", (0, 0), (-1, -1), 4),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 4),
-                ("TOPPADDING", (0, 0), (-1, -1), 2),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
-            ]))
-            story.append(table)
-            story.append(Spacer(1, 4))
-        story.append(Spacer(1, 6))
-
-    for idx, data in enumerate(audit_data):
-        # Header card per profile
-        profile = data.get("profile", "Unknown")
-        account_id = data.get("account_id", "Unknown")
-        story.append(profileHeaderCard(profile, account_id, doc.width))
-        story.append(Spacer(1, 6))
-
-        # Untagged resources (service -> region -> ids)
-        untagged = data.get("untagged_resources", {})
-        if isinstance(untagged, dict):
-            story.append(miniHeader("Untagged Resources"))
-            has_any = False
-            for service in sorted(untagged.keys()):
-                region_map = untagged.get(service) or {}
-                if not region_map:
-                    continue
-                has_any = True
-                story.append(paragraphStyling(f"<b>{service}</b>"))
-                _render_region_items_wrapped("", region_map, columns=2)
-            if not has_any:
-                story.append(paragraphStyling("None found"))
-                story.append(Spacer(1, 6))
-        else:
-            story.append(miniHeader("Untagged Resources"))
-            story.append(bulletList(split_to_items(untagged)))
-            story.append(Spacer(1, 6))
-
-        # Stopped EC2 instances (region -> ids)
-        stopped = data.get("stopped_instances", {})
-        if isinstance(stopped, dict):
-            _render_region_items("Stopped EC2 Instances", stopped, columns=3)
-        else:
-            story.append(miniHeader("Stopped EC2 Instances"))
-            story.append(bulletList(split_to_items(stopped)))
-            story.append(Spacer(1, 6))
-
-        # Unused EBS volumes (region -> ids)
-        volumes = data.get("unused_volumes", {})
-        if isinstance(volumes, dict):
-            _render_region_items("Unused EBS Volumes", volumes, columns=3)
-        else:
-            story.append(miniHeader("Unused EBS Volumes"))
-            story.append(bulletList(split_to_items(volumes)))
-            story.append(Spacer(1, 6))
-
-        # Unused EIPs (region -> ids)
-        eips = data.get("unused_eips", {})
-        if isinstance(eips, dict):
-            _render_region_items("Unused Elastic IPs", eips, columns=3)
-        else:
-            story.append(miniHeader("Unused Elastic IPs"))
-            story.append(bulletList(split_to_items(eips)))
-            story.append(Spacer(1, 6))
-
-        # Budget Alerts
-        story.append(miniHeader("Budget Alerts"))
-        budget_alerts = data.get("budget_alerts", "No budgets exceeded")
-        if isinstance(budget_alerts, list):
-            if not budget_alerts:
-                story.append(paragraphStyling("No budgets exceeded"))
-            else:
-                budget_lines = []
-                for b in budget_alerts:
-                    if isinstance(b, dict):
-                        if b.get("actual", 0) > b.get("limit", 0):
-                            budget_lines.append(
-                                f"{b.get('name', 'Budget')}: "
-                                f"${b.get('actual', 0):,.2f} > ${b.get('limit', 0):,.2f}"
-                            )
-                    else:
-                        budget_lines.append(str(b))
-                story.append(bulletList(budget_lines or ["No budgets exceeded"]))
-        else:
-            story.append(bulletList(split_to_items(budget_alerts)))
-        story.append(Spacer(1, 6))
-
-        # Add spacing between profiles
-        if idx < len(audit_data) - 1:
-            story.append(Spacer(1, 8))
-            story.append(_profile_separator())
-            story.append(Spacer(1, 10))
-
-    # Footer
-    story.append(Spacer(1, 8))
-    footer_note = (
-        "Note: This scan checks stopped EC2, unattached EBS volumes, unused EIPs, "
-        "untagged EC2/RDS/Lambda/ELBv2 resources, and budget alerts."
+    from reportlab.platypus import Paragraph, Spacer
+
+    from aws_costlens.pdf_renderer import (
+        audit_profile_story,
+        footerParagraph,
+        profile_separator,
+        styles,
     )
-    story.append(footerParagraph(footer_note))
-    footer_text = f"Generated by AWS CostLens on {datetime.now():%Y-%m-%d %H:%M:%S}"
-    story.append(footerParagraph(footer_text))
 
-    doc.build(story)
-    buffer.seek(0)
-    pdf_bytes = buffer.read()
+    def _story(width: float) -> List:
+        story = [
+            # Main Title
+            Paragraph("AWS CostLens (Scan Report)", styles["Title"]),
+            Spacer(1, 8),
+        ]
 
-    if output_path:
-        with open(output_path, "wb") as f:
-            f.write(pdf_bytes)
-        console.print(f"[green]✓ Scan PDF saved to {output_path}[/]")
+        for idx, data in enumerate(audit_data):
+            # Add spacing between profiles
+            if idx:
+                story.extend([Spacer(1, 8), profile_separator(width), Spacer(1, 10)])
+            story.extend(audit_profile_story(data, width))
+
+        # Footer
+        story.append(Spacer(1, 8))
+        footer_note = (
+            "Note: This scan checks stopped EC2, unattached EBS volumes, unused EIPs, "
+            "untagged EC2/RDS/Lambda/ELBv2 resources, and budget alerts."
+        )
+        story.append(footerParagraph(footer_note))
+        footer_text = f"Generated by AWS CostLens on {generated_at or datetime.now():%Y-%m-%d %H:%M:%S}"
+        story.append(footerParagraph(footer_text))
+        return story
+
+    pdf_bytes = _export_pdf(_story, output_path, output_fileobj)
+    if output_path and output_fileobj is None:
+        emit(f"✓ Scan PDF saved to {output_path}", "green")
 
     return pdf_bytes
 
 
-def export_audit_report_to_csv(audit_data: List[Dict], output_path: Optional[str] = None) -> str:
-    """Export scan report to CSV format (one item per row)."""
-    import csv
-    from io import StringIO
+AUDIT_CSV_HEADER = ["Profile", "Account ID", "Category", "Region", "Item", "Details"]
 
-    output = StringIO()
-    writer = csv.writer(output)
+# (audit_data key, CSV category) for the region -> ids sections
+_AUDIT_REGION_CATEGORIES = (
+    ("stopped_instances", "Stopped EC2"),
+    ("unused_volumes", "Unused Volume"),
+    ("unused_eips", "Unused EIP"),
+)
 
-    writer.writerow(["Profile", "Account ID", "Category", "Region", "Item", "Details"])
 
+def iter_audit_rows(audit_data: List[Dict]) -> Iterator[List[str]]:
+    """Yield scan report CSV rows (one item per row, blank row between profiles)."""
     for data in audit_data:
         profile = data.get("profile", "Unknown")
         account_id = data.get("account_id", "Unknown")
 
-        # Stopped EC2 instances
-        stopped = data.get("stopped_instances") or {}
-        if stopped:
-            for region, ids in stopped.items():
-                for instance_id in ids:
-                    writer.writerow([profile, account_id, "Stopped EC2", region, instance_id, ""])
-        else:
-            writer.writerow([profile, account_id, "Stopped EC2", "", "None", ""])
-
-        # Unused volumes
-        volumes = data.get("unused_volumes") or {}
-        if volumes:
-            for region, ids in volumes.items():
-                for volume_id in ids:
-                    writer.writerow([profile, account_id, "Unused Volume", region, volume_id, ""])
-        else:
-            writer.writerow([profile, account_id, "Unused Volume", "", "None", ""])
-
-        # Unused EIPs
-        eips = data.get("unused_eips") or {}
-        if eips:
-            for region, ips in eips.items():
-                for ip in ips:
-                    writer.writerow([profile, account_id, "Unused EIP", region, ip, ""])
-        else:
-            writer.writerow([profile, account_id, "Unused EIP", "", "None", ""])
+        # Stopped EC2 instances, unused volumes, unused EIPs (region -> ids)
+        for key, category in _AUDIT_REGION_CATEGORIES:
+            region_map = data.get(key) or {}
+            if region_map:
+                for region, ids in region_map.items():
+                    for item in ids:
+                        yield [profile, account_id, category, region, item, ""]
+            else:
+                yield [profile, account_id, category, "", "None", ""]
 
         # Untagged resources
         untagged = data.get("untagged_resources") or {}
@@ -543,71 +346,131 @@ def export_audit_report_to_csv(audit_data: List[Dict], output_path: Optional[str
                 if region_map:
                     for region, ids in region_map.items():
                         for resource_id in ids:
-                            writer.writerow(
-                                [profile, account_id, f"Untagged {service}", region, resource_id, ""]
-                            )
+                            yield [profile, account_id, f"Untagged {service}", region, resource_id, ""]
         else:
-            writer.writerow([profile, account_id, "Untagged Resources", "", "None", ""])
+            yield [profile, account_id, "Untagged Resources", "", "None", ""]
 
         # Budget alerts (only exceeded budgets)
         budgets = data.get("budget_alerts") or []
-        alerts = [
-            b for b in budgets
-            if b.get("actual", 0) > b.get("limit", 0)
-        ]
+        alerts = [b for b in budgets if b.actual > b.limit]
         if alerts:
             for b in alerts:
-                details = f"${b['actual']:.2f} > ${b['limit']:.2f}"
-                writer.writerow([profile, account_id, "Budget Alert", "", b.get("name", "Unknown"), details])
+                details = f"${b.actual:.2f} > ${b.limit:.2f}"
+                yield [profile, account_id, "Budget Alert", "", b.name, details]
         else:
-            writer.writerow([profile, account_id, "Budget Alerts", "", "No budgets exceeded", ""])
+            yield [profile, account_id, "Budget Alerts", "", "No budgets exceeded", ""]
+
+        yield []
+
+
+def export_audit_report_to_csv_stream(audit_data: List[Dict], fileobj: TextIO) -> None:
+    """Write scan report CSV rows straight to an open text file object."""
+    writer = csv.writer(fileobj)
+    writer.writerow(AUDIT_CSV_HEADER)
+    writer.writerows(iter_audit_rows(audit_data))
 
-        writer.writerow([])
 
+def export_audit_report_to_csv(audit_data: List[Dict], output_path: Optional[str] = None) -> str:
+    """Export scan report to CSV format (one item per row)."""
+    output = StringIO()
+    export_audit_report_to_csv_stream(audit_data, output)
     csv_content = output.getvalue()
 
     if output_path:
         with open(output_path, "w", encoding="utf-8") as f:
             f.write(csv_content)
-        console.print(f"[green]✓ Audit CSV saved to {output_path}[/]")
+        emit(f"✓ Audit CSV saved to {output_path}", "green")
 
     return csv_content
 
 
-def export_audit_report_to_json(audit_data: List[Dict], output_path: Optional[str] = None) -> str:
-    """Export scan report to JSON format."""
+def export_audit_report_to_parquet(audit_data: List[Dict], fileobj: BinaryIO) -> None:
+    """
+    Export scan report to a zstd-compressed Parquet file.
+
+    Uses the same columns as the CSV export (one item per row). Parquet is
+    the recommended format for pipelines that re-ingest CostLens output.
+    Requires the optional pyarrow dependency.
+
+    Args:
+        audit_data: List of audit data dictionaries
+        fileobj: Binary file object to write to
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "Parquet export requires pyarrow: pip install \"devops-aws-costlens[parquet]\""
+        ) from e
+
+    columns: List[List[str]] = [[] for _ in AUDIT_CSV_HEADER]
+    for row in iter_audit_rows(audit_data):
+        if not row:  # Profile separator rows only matter for CSV
+            continue
+        for column, value in zip(columns, row):
+            column.append(value)
+
+    table = pa.Table.from_arrays(
+        [pa.array(column, type=pa.string()) for column in columns],
+        names=AUDIT_CSV_HEADER,
+    )
+    pq.write_table(table, fileobj, compression="zstd")
+
+
+def export_audit_report_to_json(
+    audit_data: List[Dict],
+    output_path: Optional[str] = None,
+    generated_at: Optional[datetime] = None,
+    output_fileobj: Optional[BinaryIO] = None,
+) -> Optional[bytes]:
+    """Export scan report to JSON format (UTF-8 encoded).
+
+    Returns:
+        JSON bytes, b"" when written to output_path, or None when written to
+        output_fileobj
+    """
     output = {
         "report_type": "audit",
-        "generated": datetime.now().isoformat(),
+        "generated": generated_at or datetime.now(),
         "profiles": audit_data,
     }
-    json_content = json.dumps(output, indent=2)
-
+    if output_fileobj is not None:
+        write_json(output, output_fileobj)
+        return None
     if output_path:
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(json_content)
-        console.print(f"[green]✓ Audit JSON saved to {output_path}[/]")
-
-    return json_content
+        with open(output_path, "wb") as f:
+            write_json(output, f)
+        emit(f"✓ Audit JSON saved to {output_path}", "green")
+        return b""
+    return to_json_bytes(output)
 
 
 def export_trend_data_to_json(
     trend_data: List[Dict],
     report_name: str,
     output_path: Optional[str] = None,
-) -> str:
-    """Export cost history data to JSON format."""
+    generated_at: Optional[datetime] = None,
+    output_fileobj: Optional[BinaryIO] = None,
+) -> Optional[bytes]:
+    """Export cost history data to JSON format (UTF-8 encoded).
+
+    Returns:
+        JSON bytes, b"" when written to output_path, or None when written to
+        output_fileobj
+    """
     output = {
         "report_name": report_name,
         "report_type": "trend",
-        "generated": datetime.now().isoformat(),
+        "generated": generated_at or datetime.now(),
         "data": trend_data,
     }
-    json_content = json.dumps(output, indent=2)
-
+    if output_fileobj is not None:
+        write_json(output, output_fileobj)
+        return None
     if output_path:
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(json_content)
-        console.print(f"[green]✓ Trend JSON saved to {output_path}[/]")
-
-    return json_content
+        with open(output_path, "wb") as f:
+            write_json(output, f)
+        emit(f"✓ Trend JSON saved to {output_path}", "green")
+        return b""
+    return to_json_bytes(output)
@@ -1,46 +1,77 @@
-"""Console setup for Windows UTF-8 compatibility."""
+"""Console setup for Windows UTF-8 compatibility and the shared Rich console."""
 
 import sys
+from typing import Optional
+
+from rich.console import Console
 
 # Only setup once
 _setup_done = False
 
 
+def _force_utf8(name: str) -> None:
+    """Switch sys.stdout or sys.stderr to UTF-8, in place when possible."""
+    stream = getattr(sys, name)
+    if (getattr(stream, "encoding", None) or "").lower() == "utf-8":
+        return
+
+    reconfigure = getattr(stream, "reconfigure", None)
+    if reconfigure is not None:
+        # Mutates the existing TextIOWrapper, so references held elsewhere
+        # keep working. Line buffering, as with the wrapper below, keeps
+        # piped progress output flowing.
+        reconfigure(encoding="utf-8", errors="replace", line_buffering=True)
+        return
+
+    # Streams replaced by something other than a TextIOWrapper
+    if hasattr(stream, "buffer"):
+        import io
+
+        setattr(
+            sys,
+            name,
+            io.TextIOWrapper(stream.buffer, encoding="utf-8", errors="replace", line_buffering=True),
+        )
+
+
 def setup_console():
     """Configure console for UTF-8 output on Windows."""
     global _setup_done
     if _setup_done:
         return
-    
+
     if sys.platform == "win32":
-        import io
-        try:
-            # Check if stdout needs UTF-8 reconfiguration
-            if hasattr(sys.stdout, 'buffer'):
-                # Check current encoding
-                current_encoding = getattr(sys.stdout, 'encoding', '').lower()
-                if current_encoding != 'utf-8':
-                    sys.stdout = io.TextIOWrapper(
-                        sys.stdout.buffer, 
-                        encoding="utf-8", 
-                        errors="replace",
-                        line_buffering=True
-                    )
-            
-            if hasattr(sys.stderr, 'buffer'):
-                current_encoding = getattr(sys.stderr, 'encoding', '').lower()
-                if current_encoding != 'utf-8':
-                    sys.stderr = io.TextIOWrapper(
-                        sys.stderr.buffer, 
-                        encoding="utf-8", 
-                        errors="replace",
-                        line_buffering=True
-                    )
-        except Exception:
-            pass  # Ignore errors if already wrapped
-    
+        for name in ("stdout", "stderr"):
+            try:
+                _force_utf8(name)
+            except Exception:
+                pass  # Leave streams we cannot reconfigure as they are
+
     _setup_done = True
 
 
 # Auto-setup on import
 setup_console()
+
+# Shared by every module. Force UTF-8 and modern Windows terminal mode for
+# Unicode support
+console = Console(force_terminal=True, legacy_windows=False)
+
+# ANSI codes for the plain status lines written by emit()
+_ANSI_COLORS = {
+    "green": "\x1b[32m",
+    "yellow": "\x1b[33m",
+    "red": "\x1b[1;31m",
+}
+
+
+def emit(message: str, color: Optional[str] = None) -> None:
+    """
+    Print a one-line status message without Rich markup parsing or rendering.
+
+    Meant for frequent plain messages (e.g. "✓ Saved to ..."); tables and
+    styled output should keep using console.print.
+    """
+    code = _ANSI_COLORS.get(color) if color and not console.no_color else None
+    line = f"{code}{message}\x1b[0m\n" if code else f"{message}\n"
+    sys.stdout.write(line)
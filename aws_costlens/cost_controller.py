@@ -1,29 +1,62 @@
 """Cost data processing and formatting controller."""
 
 import csv
-import json
 import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from io import BytesIO, StringIO
-from typing import Any, Dict, List, Optional, Tuple, Union
+from operator import itemgetter
+from typing import Any, DefaultDict, Dict, List, Optional, Tuple, Union
 
-import xlsxwriter
 from boto3.session import Session
 from botocore.exceptions import ClientError
-from rich.console import Console
 
-from aws_costlens.aws_api import get_budgets
+from aws_costlens._ce_cache import get_cost_and_usage
+from aws_costlens._clients import get_client
+from aws_costlens._regions import home_region
+from aws_costlens.aws_api import get_account_id, get_budgets
+from aws_costlens.common_utils import to_json_bytes
+from aws_costlens.console_setup import console
 from aws_costlens.models import BudgetInfo, CostData, EC2Summary
 
-# Force UTF-8 and modern Windows terminal mode for Unicode support
-console = Console(force_terminal=True, legacy_windows=False)
 
+def _first_of_prev_month(d: datetime) -> datetime:
+    """Return the first day of the month before d's month."""
+    year, month = (d.year, d.month - 1) if d.month > 1 else (d.year - 1, 12)
+    return d.replace(year=year, month=month, day=1)
 
-def get_trend(session: Session, tags: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+
+# Credits and refunds are filtered out by Cost Explorer rather than after the
+# response arrives, so they never cross the network
+_NO_CREDITS_FILTER: Dict[str, Any] = {
+    "Not": {"Dimensions": {"Key": "RECORD_TYPE", "Values": ["Credit", "Refund"]}}
+}
+
+
+def _cost_filter(
+    tags: Optional[Dict[str, str]] = None, exclude_credits: bool = False
+) -> Optional[Dict[str, Any]]:
+    """Build the Cost Explorer Filter for tag filters (ANDed) and excluded credits."""
+    expressions: List[Dict[str, Any]] = [
+        {"Tags": {"Key": key, "Values": [value]}} for key, value in (tags or {}).items()
+    ]
+    if exclude_credits:
+        expressions.append(_NO_CREDITS_FILTER)
+    if not expressions:
+        return None
+    if len(expressions) == 1:
+        return expressions[0]
+    return {"And": expressions}
+
+
+def get_trend(
+    session: Session,
+    tags: Optional[Dict[str, str]] = None,
+    exclude_credits: bool = False,
+) -> Dict[str, Any]:
     """Get 6-month cost trend data from AWS Cost Explorer."""
-    from aws_costlens.aws_api import get_account_id
-    
-    ce = session.client("ce", region_name="us-east-1")
+    ce = get_client(session, "ce", home_region("ce"))
     account_id = get_account_id(session)
     profile = session.profile_name
 
@@ -31,38 +64,22 @@ def get_trend(session: Session, tags: Optional[Dict[str, str]] = None) -> Dict[s
     end = today
     start = (end - timedelta(days=180)).replace(day=1)
 
-    # Build filter if tags provided
-    filter_param = None
-    if tags:
-        tag_filters = []
-        for key, value in tags.items():
-            tag_filters.append({
-                "Tags": {
-                    "Key": key,
-                    "Values": [value],
-                    "MatchOptions": ["EQUALS"],
-                }
-            })
-        if len(tag_filters) == 1:
-            filter_param = tag_filters[0]
-        else:
-            filter_param = {"And": tag_filters}
+    filter_param = _cost_filter(tags, exclude_credits)
 
     try:
         kwargs: Dict[str, Any] = {
-            "TimePeriod": {"Start": start.strftime("%Y-%m-%d"), "End": end.strftime("%Y-%m-%d")},
+            "TimePeriod": {"Start": start.date().isoformat(), "End": end.date().isoformat()},
             "Granularity": "MONTHLY",
             "Metrics": ["UnblendedCost"],
         }
         if filter_param:
             kwargs["Filter"] = filter_param
 
-        response = ce.get_cost_and_usage(**kwargs)
-        results = response.get("ResultsByTime", [])
+        results = get_cost_and_usage(ce, kwargs, account_id)
         monthly_costs: List[Tuple[str, float]] = []
         for r in results:
             period_start = r["TimePeriod"]["Start"]
-            month = datetime.strptime(period_start, "%Y-%m-%d").strftime("%b %Y")
+            month = datetime.fromisoformat(period_start).strftime("%b %Y")
             amount = float(r["Total"]["UnblendedCost"]["Amount"])
             monthly_costs.append((month, amount))
         
@@ -76,22 +93,19 @@ def get_trend(session: Session, tags: Optional[Dict[str, str]] = None) -> Dict[s
         return {"monthly_costs": [], "account_id": account_id, "profile": profile}
 
 
-def get_cost_data(
-    session: Session,
+def resolve_periods(
     time_range: Optional[Union[int, str]] = None,
-    tags: Optional[Dict[str, str]] = None,
-) -> CostData:
+) -> Tuple[datetime, datetime, datetime, datetime, str, str]:
     """
-    Get cost data from AWS Cost Explorer.
+    Resolve the compared periods for a time range (local date math, no AWS calls).
 
     Args:
-        session: boto3 Session
         time_range: Optional int for days or string for custom range
-        tags: Optional dict of tag filters
-    """
-    ce = session.client("ce", region_name="us-east-1")
-    account_id = session.client("sts").get_caller_identity().get("Account")
 
+    Returns:
+        (current_start, current_end, previous_start, previous_end,
+        current_period_name, previous_period_name); ends are exclusive
+    """
     today = datetime.today()
 
     # Handle custom time range
@@ -101,11 +115,11 @@ def get_cost_data(
             # Last month (full calendar month) vs month before last (full calendar month)
             # Current period = previous calendar month
             current_end = today.replace(day=1)  # First day of current month
-            current_start = (current_end - timedelta(days=1)).replace(day=1)  # First day of last month
+            current_start = _first_of_prev_month(current_end)  # First day of last month
             
             # Previous period = month before last
             previous_end = current_start  # First day of last month
-            previous_start = (previous_end - timedelta(days=1)).replace(day=1)  # First day of month before last
+            previous_start = _first_of_prev_month(previous_end)  # First day of month before last
             
             current_period_name = f"{current_start.strftime('%B %Y')} (last month)"
             previous_period_name = f"{previous_start.strftime('%B %Y')} (prior month)"
@@ -124,14 +138,14 @@ def get_cost_data(
             parts = time_range.split(":")
             if len(parts) != 2:
                 console.print(f"[bold red]Error: Invalid date range format '{time_range}'. Use YYYY-MM-DD:YYYY-MM-DD[/]")
-                parts = [today.replace(day=1).strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d")]
+                parts = [today.replace(day=1).date().isoformat(), today.date().isoformat()]
             current_start = datetime.strptime(parts[0], "%Y-%m-%d")
             current_end = datetime.strptime(parts[1], "%Y-%m-%d")
             delta = (current_end - current_start).days
             previous_start = current_start - timedelta(days=delta)
             previous_end = current_start
             current_period_name = f"{parts[0]} to {parts[1]}"
-            previous_period_name = f"{previous_start.strftime('%Y-%m-%d')} to {previous_end.strftime('%Y-%m-%d')}"
+            previous_period_name = f"{previous_start.date().isoformat()} to {previous_end.date().isoformat()}"
     else:
         # Default: current month (MTD) vs last month (full)
         current_start = today.replace(day=1)
@@ -141,29 +155,68 @@ def get_cost_data(
         if current_start == current_end:
             current_end = current_end + timedelta(days=1)
         
-        previous_start = (current_start - timedelta(days=1)).replace(day=1)
+        previous_start = _first_of_prev_month(current_start)
         previous_end = current_start
         current_period_name = f"{today.strftime('%B %Y')} (MTD)"
         previous_period_name = f"{previous_start.strftime('%B %Y')} (full month)"
 
-    # Build filter if tags provided
-    filter_expr = None
-    if tags:
-        tag_filters = []
-        for key, value in tags.items():
-            tag_filters.append({"Tags": {"Key": key, "Values": [value]}})
-        if len(tag_filters) == 1:
-            filter_expr = tag_filters[0]
-        else:
-            filter_expr = {"And": tag_filters}
+    return (
+        current_start,
+        current_end,
+        previous_start,
+        previous_end,
+        current_period_name,
+        previous_period_name,
+    )
+
 
-    def fetch_cost(start: datetime, end: datetime) -> Tuple[float, List[Dict]]:
-        """Fetch cost for a period."""
+def get_cost_data(
+    session: Session,
+    time_range: Optional[Union[int, str]] = None,
+    tags: Optional[Dict[str, str]] = None,
+    exclude_credits: bool = False,
+) -> CostData:
+    """
+    Get cost data from AWS Cost Explorer.
+
+    Args:
+        session: boto3 Session
+        time_range: Optional int for days or string for custom range
+        tags: Optional dict of tag filters
+        exclude_credits: Leave credits and refunds out of the costs
+    """
+    ce = get_client(session, "ce", home_region("ce"))
+
+    (
+        current_start,
+        current_end,
+        previous_start,
+        previous_end,
+        current_period_name,
+        previous_period_name,
+    ) = resolve_periods(time_range)
+
+    # Format each boundary once for the queries and the result
+    current_start_iso = current_start.date().isoformat()
+    current_end_iso = current_end.date().isoformat()
+    previous_start_iso = previous_start.date().isoformat()
+    previous_end_iso = previous_end.date().isoformat()
+
+    filter_expr = _cost_filter(tags, exclude_credits)
+
+    def fetch_cost(
+        start: str, end: str, split: Optional[str] = None
+    ) -> List[Tuple[float, List[Dict]]]:
+        """
+        Fetch cost for [start, end) (YYYY-MM-DD dates).
+
+        With split, monthly results starting before it and from it on are
+        summed separately, so one query covers two adjacent periods. split
+        must be the first of a month: MONTHLY results never straddle it then.
+        Returns one (total, services) pair, or two (before, from split on).
+        """
         params: Dict[str, Any] = {
-            "TimePeriod": {
-                "Start": start.strftime("%Y-%m-%d"),
-                "End": end.strftime("%Y-%m-%d"),
-            },
+            "TimePeriod": {"Start": start, "End": end},
             "Granularity": "MONTHLY",
             "Metrics": ["UnblendedCost"],
             "GroupBy": [{"Type": "DIMENSION", "Key": "SERVICE"}],
@@ -171,43 +224,57 @@ def get_cost_data(
         if filter_expr:
             params["Filter"] = filter_expr
 
+        buckets: List[DefaultDict[str, float]] = [defaultdict(float) for _ in range(2 if split else 1)]
         try:
-            response = ce.get_cost_and_usage(**params)
-            results = response.get("ResultsByTime", [])
-            total = 0.0
-            services: List[Dict] = []
-            for r in results:
+            # Sum per service across every month in the range
+            for r in get_cost_and_usage(ce, params, account_future.result()):
+                totals = buckets[split is not None and r["TimePeriod"]["Start"] >= split]
                 for group in r.get("Groups", []):
-                    service = group["Keys"][0]
-                    amount = float(group["Metrics"]["UnblendedCost"]["Amount"])
-                    total += amount
-                    services.append({"service": service, "cost": amount})
-            return total, services
+                    totals[group["Keys"][0]] += float(group["Metrics"]["UnblendedCost"]["Amount"])
         except ClientError as e:
             console.print(f"[bold red]Error fetching cost data: {e}[/]")
-            return 0.0, []
-
-    current_total, current_services = fetch_cost(current_start, current_end)
-    previous_total, previous_services = fetch_cost(previous_start, previous_end)
-
-    budgets = get_budgets(session)
-
-    return {
-        "account_id": account_id,
-        "current_month": current_total,
-        "last_month": previous_total,
-        "current_month_cost_by_service": current_services,
-        "previous_month_cost_by_service": previous_services,
-        "budgets": budgets,
-        "current_period_name": current_period_name,
-        "previous_period_name": previous_period_name,
-        "time_range": time_range,
-        "current_period_start": current_start.strftime("%Y-%m-%d"),
-        "current_period_end": current_end.strftime("%Y-%m-%d"),
-        "previous_period_start": previous_start.strftime("%Y-%m-%d"),
-        "previous_period_end": previous_end.strftime("%Y-%m-%d"),
-        "monthly_costs": None,
-    }
+            return [(0.0, [])] * len(buckets)
+        return [
+            (sum(totals.values()), [{"service": s, "cost": c} for s, c in totals.items()])
+            for totals in buckets
+        ]
+
+    # Overlap the network round-trips. fetch_cost only waits on account_future
+    # to key its response cache, and the ID is usually memoized already
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        account_future = executor.submit(get_account_id, session, True)
+        budgets_future = executor.submit(get_budgets, session)
+        if current_start.day == 1:
+            # One Cost Explorer request for both periods (CE bills per request)
+            both_future = executor.submit(
+                fetch_cost, previous_start_iso, current_end_iso, current_start_iso
+            )
+            (previous_total, previous_services), (current_total, current_services) = both_future.result()
+        else:
+            current_future = executor.submit(fetch_cost, current_start_iso, current_end_iso)
+            previous_future = executor.submit(fetch_cost, previous_start_iso, previous_end_iso)
+            current_total, current_services = current_future.result()[0]
+            previous_total, previous_services = previous_future.result()[0]
+
+        account_id = account_future.result()
+        budgets = budgets_future.result()
+
+    return CostData(
+        account_id=account_id,
+        current_month=current_total,
+        last_month=previous_total,
+        current_month_cost_by_service=current_services,
+        previous_month_cost_by_service=previous_services,
+        budgets=budgets,
+        current_period_name=current_period_name,
+        previous_period_name=previous_period_name,
+        time_range=time_range,
+        current_period_start=current_start_iso,
+        current_period_end=current_end_iso,
+        previous_period_start=previous_start_iso,
+        previous_period_end=previous_end_iso,
+        monthly_costs=None,
+    )
 
 
 def process_service_costs(services: List[Dict]) -> Tuple[List[str], List[Tuple[str, float]]]:
@@ -216,7 +283,7 @@ def process_service_costs(services: List[Dict]) -> Tuple[List[str], List[Tuple[s
     service_cost_data: List[Tuple[str, float]] = []
     
     # Sort by cost descending
-    sorted_services = sorted(services, key=lambda x: x["cost"], reverse=True)
+    sorted_services = sorted(services, key=itemgetter("cost"), reverse=True)
     
     for svc in sorted_services:
         cost = svc["cost"]
@@ -231,6 +298,10 @@ def process_service_costs(services: List[Dict]) -> Tuple[List[str], List[Tuple[s
     return service_costs_formatted, service_cost_data
 
 
+# Budget status by usage: under 80%, 80-100%, over 100%
+_BUDGET_STATUS = ("🟢", "🟡", "🔴")
+
+
 def format_budget_info(budgets: List[BudgetInfo]) -> List[str]:
     """Format budget information for display."""
     if not budgets:
@@ -238,11 +309,12 @@ def format_budget_info(budgets: List[BudgetInfo]) -> List[str]:
 
     formatted = []
     for b in budgets:
-        pct = (b["actual"] / b["limit"] * 100) if b["limit"] > 0 else 0
-        status = "🟢" if pct < 80 else "🟡" if pct < 100 else "🔴"
-        forecast_str = f", Forecast: ${b['forecast']:,.2f}" if b["forecast"] else ""
+        actual, limit, forecast = b.actual, b.limit, b.forecast
+        pct = (actual / limit * 100) if limit > 0 else 0
+        status = _BUDGET_STATUS[(pct >= 80) + (pct >= 100)]
+        forecast_str = f", Forecast: ${forecast:,.2f}" if forecast else ""
         formatted.append(
-            f"{status} {b['name']}: ${b['actual']:,.2f} / ${b['limit']:,.2f} ({pct:.1f}%){forecast_str}"
+            f"{status} {b.name}: ${actual:,.2f} / ${limit:,.2f} ({pct:.1f}%){forecast_str}"
         )
     return formatted
 
@@ -288,49 +360,39 @@ def export_to_csv(
         "EC2 Instances",
     ]
     
-    writer = csv.DictWriter(output, fieldnames=fieldnames)
-    writer.writeheader()
-    
-    for profile_data in export_data:
-        # Format previous services as multi-line string
-        prev_services = profile_data.get("previous_service_costs", [])
+    fmt = "${:,.2f}".format
+    fmt_service = "{}: ${:,.2f}".format
+
+    def _row(profile_data: Dict) -> Tuple:
+        # Services, budgets and EC2 states as multi-line cells
         prev_services_str = "\n".join(
-            f"{service}: ${cost:,.2f}" for service, cost in prev_services
+            [fmt_service(service, cost) for service, cost in profile_data.get("previous_service_costs", [])]
         ) or "No costs"
-        
-        # Format current services as multi-line string
-        curr_services = profile_data.get("service_costs", [])
         curr_services_str = "\n".join(
-            f"{service}: ${cost:,.2f}" for service, cost in curr_services
+            [fmt_service(service, cost) for service, cost in profile_data.get("service_costs", [])]
         ) or "No costs"
-        
-        # Format budgets as multi-line string
         budgets = profile_data.get("budget_info", [])
         budgets_str = "\n".join(budgets) if budgets else "No budgets"
-        
-        # Format EC2 summary as multi-line string
-        ec2_summary = profile_data.get("ec2_summary", {})
         ec2_str = "\n".join(
-            f"{state}: {count}" 
-            for state, count in ec2_summary.items() 
-            if count > 0
+            [f"{state}: {count}" for state, count in profile_data.get("ec2_summary", {}).items() if count > 0]
         ) or "No instances"
-        
-        # Format percentage change
         pct = profile_data.get("percent_change_in_total_cost")
-        pct_str = f"{pct:+.2f}%" if pct is not None else "N/A"
-        
-        writer.writerow({
-            "CLI Profile": profile_data.get("profile", "N/A"),
-            "AWS Account ID": profile_data.get("account_id", "N/A"),
-            previous_period_header: f"${profile_data.get('last_month', 0):,.2f}",
-            current_period_header: f"${profile_data.get('current_month', 0):,.2f}",
-            "Change %": pct_str,
-            "Previous Period Cost By Service": prev_services_str,
-            "Current Period Cost By Service": curr_services_str,
-            "Budget Status": budgets_str,
-            "EC2 Instances": ec2_str,
-        })
+
+        return (
+            profile_data.get("profile", "N/A"),
+            profile_data.get("account_id", "N/A"),
+            fmt(profile_data.get("last_month", 0)),
+            fmt(profile_data.get("current_month", 0)),
+            f"{pct:+.2f}%" if pct is not None else "N/A",
+            prev_services_str,
+            curr_services_str,
+            budgets_str,
+            ec2_str,
+        )
+
+    writer = csv.writer(output)
+    writer.writerow(fieldnames)
+    writer.writerows(map(_row, export_data))
     
     return output.getvalue()
 
@@ -338,11 +400,13 @@ def export_to_csv(
 def export_to_json(
     export_data: List[Dict],
     report_name: str,
-) -> str:
-    """Export cost data to JSON format."""
+    generated_at: Optional[datetime] = None,
+    pretty: bool = True,
+) -> bytes:
+    """Export cost data to JSON format (UTF-8 encoded)."""
     output = {
         "report_name": report_name,
-        "generated": datetime.now().isoformat(),
+        "generated": (generated_at or datetime.now()).isoformat(),
         "profiles": []
     }
     
@@ -360,7 +424,7 @@ def export_to_json(
         }
         output["profiles"].append(profile_output)
     
-    return json.dumps(output, indent=2)
+    return to_json_bytes(output, pretty=pretty)
 
 
 def export_to_xlsx(
@@ -372,6 +436,7 @@ def export_to_xlsx(
     current_period_dates: str,
 ) -> bytes:
     """Export cost data to XLSX format (one sheet per account + global sheet)."""
+    import xlsxwriter
 
     def safe_sheet_name(name: str, fallback: str, used_names: set) -> str:
         cleaned = re.sub(r"[\[\]\*:/\\?]", "", name).strip()
@@ -575,5 +640,4 @@ def export_to_xlsx(
         table_counter += 1
 
     workbook.close()
-    output.seek(0)
-    return output.read()
+    return output.getvalue()
@@ -1,10 +1,33 @@
 """Type definitions and data models for AWS CostLens."""
 
-from typing import Dict, List, Optional, Tuple, TypedDict, Union
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, TypedDict, Union
 
 
-class BudgetInfo(TypedDict):
-    """Type for a budget entry."""
+class _FrozenSlots:
+    """
+    Pickle and copy support for frozen dataclasses with hand-written __slots__.
+
+    Default slot state is restored through setattr, which a frozen dataclass
+    rejects, so the fields are set with object.__setattr__ instead.
+    """
+
+    __slots__: Tuple[str, ...] = ()
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+@dataclass(frozen=True)
+class BudgetInfo(_FrozenSlots):
+    """A budget entry (slotted, so attribute reads skip the instance dict)."""
+
+    __slots__ = ("name", "limit", "actual", "forecast")
 
     name: str
     limit: float
@@ -12,8 +35,26 @@ class BudgetInfo(TypedDict):
     forecast: Optional[float]
 
 
-class CostData(TypedDict):
-    """Type for cost data returned from AWS Cost Explorer."""
+@dataclass(frozen=True)
+class CostData(_FrozenSlots):
+    """Cost data returned from AWS Cost Explorer (slotted and frozen, like BudgetInfo)."""
+
+    __slots__ = (
+        "account_id",
+        "current_month",
+        "last_month",
+        "current_month_cost_by_service",
+        "previous_month_cost_by_service",
+        "budgets",
+        "current_period_name",
+        "previous_period_name",
+        "time_range",
+        "current_period_start",
+        "current_period_end",
+        "previous_period_start",
+        "previous_period_end",
+        "monthly_costs",
+    )
 
     account_id: Optional[str]
     current_month: float
@@ -42,6 +83,7 @@ class ProfileData(TypedDict):
     service_costs_formatted: List[str]
     previous_service_costs: List[Tuple[str, float]]
     previous_service_costs_formatted: List[str]
+    previous_service_costs_map: Dict[str, float]
     budget_info: List[str]
     ec2_summary: Dict[str, int]
     ec2_summary_formatted: List[str]
@@ -52,6 +94,24 @@ class ProfileData(TypedDict):
     percent_change_in_total_cost: Optional[float]
 
 
+@dataclass(frozen=True)
+class ReportContext:
+    """Values shared by every report written during one CostLens run."""
+
+    generated_at: datetime
+    timestamp: str
+    previous_period_name: str = "Last Month Due"
+    current_period_name: str = "Current Month Cost"
+    previous_period_dates: str = "N/A"
+    current_period_dates: str = "N/A"
+
+    @classmethod
+    def now(cls) -> "ReportContext":
+        """Create a context stamped with the current local time."""
+        generated_at = datetime.now()
+        return cls(generated_at=generated_at, timestamp=f"{generated_at:%Y%m%d_%H%M}")
+
+
 class CLIArgs(TypedDict, total=False):
     """Type for CLI arguments."""
 
@@ -1,16 +1,22 @@
 """PDF rendering utilities for report generation."""
 
+from functools import lru_cache
+from typing import Dict, List
+
+from reportlab.lib import colors
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import inch
 from reportlab.platypus import (
+    ListFlowable,
+    ListItem,
     Paragraph,
+    Spacer,
     Table,
     TableStyle,
-    ListFlowable,
-    ListItem,
 )
-from reportlab.lib import colors
-from reportlab.lib.units import inch
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from typing import List
+
+from aws_costlens.common_utils import clean_rich_tags_many
+from aws_costlens.models import BudgetInfo
 
 styles = getSampleStyleSheet()
 
@@ -25,16 +31,20 @@ pdf_footer_style = ParagraphStyle(
 )
 
 
-def paragraphStyling(text: str, style_name="BodyText", font_size=9, leading=11):
-    """Create a styled paragraph."""
-    base = styles[style_name]
-    st = ParagraphStyle(
+@lru_cache(maxsize=None)
+def _cell_style(style_name: str, font_size: float, leading: float) -> ParagraphStyle:
+    """Return a shared cell style (Paragraph never mutates its style, so reuse is safe)."""
+    return ParagraphStyle(
         f"{style_name}_cell",
-        parent=base,
+        parent=styles[style_name],
         fontSize=font_size,
         leading=leading,
     )
-    return Paragraph(text, st)
+
+
+def paragraphStyling(text: str, style_name="BodyText", font_size=9, leading=11):
+    """Create a styled paragraph."""
+    return Paragraph(text, _cell_style(style_name, font_size, leading))
 
 
 def miniHeader(text: str):
@@ -115,3 +125,296 @@ def profileHeaderCard(profile: str, account_id: str, doc_width: float):
 def footerParagraph(text: str):
     """Create a footer paragraph with footer styling."""
     return Paragraph(text, pdf_footer_style)
+
+
+def profile_separator(width: float) -> Table:
+    """Create a thin horizontal rule between profile sections."""
+    separator = Table(
+        [[" "]],
+        colWidths=[width],
+        hAlign="LEFT",
+    )
+    separator.setStyle(TableStyle([
+        ("LINEBELOW", (0, 0), (-1, -1), 0.75, colors.HexColor("#BFBFBF")),
+    ]))
+    return separator
+
+
+def cost_profile_story(profile_data: Dict, width: float) -> List:
+    """Build the cost dashboard flowables for a single profile."""
+    story: List = []
+
+    # Header card per profile
+    profile = profile_data.get("profile", "N/A")
+    account_id = profile_data.get("account_id", "N/A")
+    story.extend([profileHeaderCard(profile, account_id, width), Spacer(1, 6)])
+
+    # Cost summary with percentage change
+    pct = profile_data.get("percent_change_in_total_cost")
+    pct_str = f" ({pct:+.1f}%)" if pct is not None else ""
+    kv_rows = [
+        ("Previous Period Cost", f"<b>${profile_data.get('last_month', 0):,.2f}</b>"),
+        ("Current Period Cost", f"<b>${profile_data.get('current_month', 0):,.2f}</b>{pct_str}"),
+    ]
+    story.extend([keyValueTable(kv_rows), Spacer(1, 6)])
+
+    # Service comparison table
+    story.append(miniHeader("Service Cost Comparison"))
+
+    curr_services = profile_data.get("service_costs", [])
+
+    prev_map = profile_data.get("previous_service_costs_map") or dict(
+        profile_data.get("previous_service_costs", [])
+    )
+    curr_map = dict(curr_services)
+    services = sorted(set(prev_map) | set(curr_map), key=lambda s: curr_map.get(s, 0), reverse=True)
+
+    table_rows = [
+        [
+            paragraphStyling("<b>Service</b>"),
+            paragraphStyling("<b>Previous</b>"),
+            paragraphStyling("<b>Current</b>"),
+            paragraphStyling("<b>Diff</b>"),
+            paragraphStyling("<b>Diff %</b>"),
+        ]
+    ]
+
+    # Total row
+    prev_total = float(profile_data.get("last_month", 0))
+    curr_total = float(profile_data.get("current_month", 0))
+    total_diff = curr_total - prev_total
+    total_pct = (total_diff / prev_total * 100.0) if abs(prev_total) > 0.0001 else None
+    table_rows.append([
+        paragraphStyling("<b>Total costs</b>"),
+        paragraphStyling(f"<b>${prev_total:,.2f}</b>"),
+        paragraphStyling(f"<b>${curr_total:,.2f}</b>"),
+        paragraphStyling(f"<b>${total_diff:,.2f}</b>"),
+        paragraphStyling(f"<b>{total_pct:+.2f}%</b>" if total_pct is not None else "<b>N/A</b>"),
+    ])
+
+    # Bound once, this loop runs per service per profile
+    fmt_money = "${:,.2f}".format
+    fmt_pct = "{:+.2f}%".format
+    prev_get = prev_map.get
+    curr_get = curr_map.get
+    append = table_rows.append
+    for svc in services:
+        prev_cost = float(prev_get(svc, 0.0))
+        curr_cost = float(curr_get(svc, 0.0))
+        if prev_cost < 0.0001 and curr_cost < 0.0001:
+            continue
+        diff = curr_cost - prev_cost
+        diff_pct = fmt_pct(diff / prev_cost * 100.0) if abs(prev_cost) > 0.0001 else "N/A"
+        append([
+            paragraphStyling(svc),
+            paragraphStyling(fmt_money(prev_cost)),
+            paragraphStyling(fmt_money(curr_cost)),
+            paragraphStyling(fmt_money(diff)),
+            paragraphStyling(diff_pct),
+        ])
+
+    service_table = Table(
+        table_rows,
+        colWidths=[2.8 * inch, 1.2 * inch, 1.2 * inch, 1.2 * inch, 1.1 * inch],
+        hAlign="LEFT",
+    )
+    service_table.setStyle(TableStyle([
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#D9E1F2")),
+        ("GRID", (0, 0), (-1, -1), 0.25, colors.HexColor("#CCCCCC")),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+        ("LEFTPADDING", (0, 0), (-1, -1), 4),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 4),
+        ("TOPPADDING", (0, 0), (-1, -1), 2),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
+    ]))
+    story.extend([service_table, Spacer(1, 8)])
+
+    # Budgets and EC2 side-by-side
+    budgets = clean_rich_tags_many(profile_data.get("budget_info", ["No budgets configured"]))
+    ec2_summary = profile_data.get("ec2_summary", {})
+    ec2_items = [
+        f"{state}: {count}"
+        for state, count in ec2_summary.items()
+        if count > 0
+    ] or ["No instances"]
+
+    info_table = Table(
+        [
+            [paragraphStyling("<b>Budgets</b>"), paragraphStyling("<b>EC2 Summary</b>")],
+            [bulletList(budgets), bulletList(ec2_items)],
+        ],
+        colWidths=[width / 2, width / 2],
+        hAlign="LEFT",
+    )
+    info_table.setStyle(TableStyle([
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#F2F2F2")),
+        ("GRID", (0, 0), (-1, -1), 0.25, colors.HexColor("#CCCCCC")),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+        ("LEFTPADDING", (0, 0), (-1, -1), 6),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 6),
+        ("TOPPADDING", (0, 0), (-1, -1), 4),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+    ]))
+    story.append(info_table)
+
+    return story
+
+
+def region_header(text: str, width: float) -> Table:
+    """Create a shaded region header row."""
+    header = Table(
+        [[paragraphStyling(f"<b>{text}</b>")]],
+        colWidths=[width],
+        hAlign="LEFT",
+    )
+    header.setStyle(TableStyle([
+        ("BACKGROUND", (0, 0), (-1, -1), colors.HexColor("#F2F2F2")),
+        ("LEFTPADDING", (0, 0), (-1, -1), 4),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 4),
+        ("TOPPADDING", (0, 0), (-1, -1), 2),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
+    ]))
+    return header
+
+
+def chunk_rows(items: List[str], columns: int) -> List[List[str]]:
+    """Split items into table rows of a fixed column count."""
+    rows = []
+    row = []
+    for item in items:
+        row.append(item)
+        if len(row) == columns:
+            rows.append(row)
+            row = []
+    if row:
+        row.extend([""] * (columns - len(row)))
+        rows.append(row)
+    return rows or [["None"] + [""] * (columns - 1)]
+
+
+def region_grid_style() -> TableStyle:
+    """Table style shared by the per-region item grids."""
+    return TableStyle([
+        ("GRID", (0, 0), (-1, -1), 0.25, colors.HexColor("#CCCCCC")),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+        ("LEFTPADDING", (0, 0), (-1, -1), 4),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 4),
+        ("TOPPADDING", (0, 0), (-1, -1), 2),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
+    ])
+
+
+def region_items_story(
+    title: str, region_map: Dict[str, List[str]], width: float, columns: int = 3
+) -> List:
+    """Build flowables listing resource ids per region as a plain grid."""
+    story: List = []
+    if title:
+        story.append(miniHeader(title))
+
+    for region in sorted(region_map.keys()):
+        items = region_map.get(region, []) or []
+        story.append(region_header(f"{region}:", width))
+        table = Table(
+            chunk_rows(items, columns),
+            colWidths=[width / columns] * columns,
+            hAlign="LEFT",
+        )
+        table.setStyle(region_grid_style())
+        story.extend([table, Spacer(1, 4)])
+    story.append(Spacer(1, 6))
+    return story
+
+
+def region_items_wrapped_story(
+    title: str, region_map: Dict[str, List[str]], width: float, columns: int = 2
+) -> List:
+    """Build flowables listing resource ids per region with wrapping cells."""
+    story: List = []
+    if title:
+        story.append(miniHeader(title))
+
+    for region in sorted(region_map.keys()):
+        items = region_map.get(region, []) or []
+        story.append(region_header(f"{region}:", width))
+        if not items:
+            story.extend([paragraphStyling("None found"), Spacer(1, 4)])
+            continue
+
+        table_rows = [
+            [paragraphStyling(item) if item else paragraphStyling("") for item in row]
+            for row in chunk_rows(items, columns)
+        ]
+        table = Table(
+            table_rows,
+            colWidths=[width / columns] * columns,
+            hAlign="LEFT",
+        )
+        table.setStyle(region_grid_style())
+        story.extend([table, Spacer(1, 4)])
+    story.append(Spacer(1, 6))
+    return story
+
+
+def audit_profile_story(data: Dict, width: float) -> List:
+    """Build the scan report flowables for a single profile."""
+    story: List = []
+
+    # Header card per profile
+    profile = data.get("profile", "Unknown")
+    account_id = data.get("account_id", "Unknown")
+    story.extend([profileHeaderCard(profile, account_id, width), Spacer(1, 6)])
+
+    # Finding sections with nothing in them are left out entirely
+    findings: List = []
+
+    # Untagged resources (service -> region -> ids)
+    untagged = data.get("untagged_resources", {})
+    if isinstance(untagged, dict):
+        for service in sorted(untagged.keys()):
+            region_map = untagged.get(service) or {}
+            if not region_map:
+                continue
+            if not findings:
+                findings.append(miniHeader("Untagged Resources"))
+            findings.append(paragraphStyling(f"<b>{service}</b>"))
+            findings.extend(region_items_wrapped_story("", region_map, width, columns=2))
+    elif untagged:
+        findings.extend([miniHeader("Untagged Resources"), bulletList(split_to_items(untagged)), Spacer(1, 6)])
+
+    # Stopped EC2 instances, unused EBS volumes, unused EIPs (region -> ids)
+    for key, title in (
+        ("stopped_instances", "Stopped EC2 Instances"),
+        ("unused_volumes", "Unused EBS Volumes"),
+        ("unused_eips", "Unused Elastic IPs"),
+    ):
+        region_map = data.get(key, {})
+        if not region_map:
+            continue
+        if isinstance(region_map, dict):
+            findings.extend(region_items_story(title, region_map, width, columns=3))
+        else:
+            findings.extend([miniHeader(title), bulletList(split_to_items(region_map)), Spacer(1, 6)])
+
+    story.extend(findings or [paragraphStyling("No findings"), Spacer(1, 6)])
+
+    # Budget Alerts
+    story.append(miniHeader("Budget Alerts"))
+    budget_alerts = data.get("budget_alerts", "No budgets exceeded")
+    if isinstance(budget_alerts, list):
+        if not budget_alerts:
+            story.append(paragraphStyling("No budgets exceeded"))
+        else:
+            budget_lines = []
+            for b in budget_alerts:
+                if isinstance(b, BudgetInfo):
+                    if b.actual > b.limit:
+                        budget_lines.append(f"{b.name}: ${b.actual:,.2f} > ${b.limit:,.2f}")
+                else:
+                    budget_lines.append(str(b))
+            story.append(bulletList(budget_lines or ["No budgets exceeded"]))
+    else:
+        story.append(bulletList(split_to_items(budget_alerts)))
+    story.append(Spacer(1, 6))
+
+    return story
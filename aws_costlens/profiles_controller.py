@@ -2,10 +2,13 @@
 
 from typing import Dict, List, Optional, Union
 
-import boto3
-from rich.console import Console
-
-from aws_costlens.aws_api import ec2_summary, get_accessible_regions, get_account_id
+from aws_costlens.aws_api import (
+    ec2_summary,
+    get_accessible_regions,
+    get_account_id,
+    get_session,
+)
+from aws_costlens.console_setup import console
 from aws_costlens.cost_controller import (
     change_in_total_cost,
     format_budget_info,
@@ -15,15 +18,13 @@ from aws_costlens.cost_controller import (
 )
 from aws_costlens.models import ProfileData
 
-# Force UTF-8 and modern Windows terminal mode for Unicode support
-console = Console(force_terminal=True, legacy_windows=False)
-
 
 def process_single_profile(
     profile: str,
     regions: Optional[List[str]] = None,
     time_range: Optional[Union[int, str]] = None,
     tags: Optional[Dict[str, str]] = None,
+    exclude_credits: bool = False,
 ) -> ProfileData:
     """
     Process cost and resource data for a single AWS profile.
@@ -33,23 +34,24 @@ def process_single_profile(
         regions: Optional list of regions to check
         time_range: Optional time range for cost data
         tags: Optional tag filters
+        exclude_credits: Leave credits and refunds out of the costs
 
     Returns:
         ProfileData dict with all processed information
     """
     try:
-        session = boto3.Session(profile_name=profile)
+        session = get_session(profile)
         account_id = get_account_id(session) or "Unknown"
 
         # Get cost data
-        cost_data = get_cost_data(session, time_range=time_range, tags=tags)
+        cost_data = get_cost_data(session, time_range=time_range, tags=tags, exclude_credits=exclude_credits)
 
         # Process service costs (returns formatted list and data tuples)
         current_formatted, current_data = process_service_costs(
-            cost_data["current_month_cost_by_service"]
+            cost_data.current_month_cost_by_service
         )
         previous_formatted, previous_data = process_service_costs(
-            cost_data["previous_month_cost_by_service"]
+            cost_data.previous_month_cost_by_service
         )
 
         # Get EC2 summary - use ALL accessible regions if not specified
@@ -58,25 +60,26 @@ def process_single_profile(
 
         # Calculate percent change
         pct_change = change_in_total_cost(
-            cost_data["current_month"], cost_data["last_month"]
+            cost_data.current_month, cost_data.last_month
         )
 
         return {
             "profile": profile,
             "account_id": account_id,
-            "last_month": cost_data["last_month"],
-            "current_month": cost_data["current_month"],
+            "last_month": cost_data.last_month,
+            "current_month": cost_data.current_month,
             "service_costs": current_data,
             "service_costs_formatted": current_formatted,
             "previous_service_costs": previous_data,
             "previous_service_costs_formatted": previous_formatted,
-            "budget_info": format_budget_info(cost_data["budgets"]),
+            "previous_service_costs_map": dict(previous_data),
+            "budget_info": format_budget_info(cost_data.budgets),
             "ec2_summary": dict(ec2_data),
             "ec2_summary_formatted": format_ec2_summary(ec2_data),
             "success": True,
             "error": None,
-            "current_period_name": cost_data["current_period_name"],
-            "previous_period_name": cost_data["previous_period_name"],
+            "current_period_name": cost_data.current_period_name,
+            "previous_period_name": cost_data.previous_period_name,
             "percent_change_in_total_cost": pct_change,
         }
 
@@ -91,6 +94,7 @@ def process_single_profile(
             "service_costs_formatted": [],
             "previous_service_costs": [],
             "previous_service_costs_formatted": [],
+            "previous_service_costs_map": {},
             "budget_info": [],
             "ec2_summary": {},
             "ec2_summary_formatted": [],
@@ -108,6 +112,7 @@ def process_combined_profiles(
     regions: Optional[List[str]] = None,
     time_range: Optional[Union[int, str]] = None,
     tags: Optional[Dict[str, str]] = None,
+    exclude_credits: bool = False,
 ) -> ProfileData:
     """
     Process and merge cost data from multiple profiles for the same account.
@@ -121,6 +126,7 @@ def process_combined_profiles(
         regions: Optional list of regions
         time_range: Optional time range
         tags: Optional tag filters
+        exclude_credits: Leave credits and refunds out of the costs
 
     Returns:
         Merged ProfileData
@@ -134,6 +140,7 @@ def process_combined_profiles(
         "service_costs_formatted": [],
         "previous_service_costs": [],
         "previous_service_costs_formatted": [],
+        "previous_service_costs_map": {},
         "budget_info": [],
         "ec2_summary": {"running": 0, "stopped": 0},
         "ec2_summary_formatted": [],
@@ -150,7 +157,7 @@ def process_combined_profiles(
     all_budgets: List[str] = []
 
     for profile in profiles:
-        data = process_single_profile(profile, regions, time_range, tags)
+        data = process_single_profile(profile, regions, time_range, tags, exclude_credits)
         if not data["success"]:
             continue
 
@@ -190,6 +197,7 @@ def process_combined_profiles(
         f"{svc}: ${cost:,.2f}" for svc, cost in sorted_current
     ] or ["No costs associated with this account"]
     combined["previous_service_costs"] = sorted_previous
+    combined["previous_service_costs_map"] = dict(sorted_previous)
     combined["previous_service_costs_formatted"] = [
         f"{svc}: ${cost:,.2f}" for svc, cost in sorted_previous
     ] or ["No costs associated with this account"]
@@ -1,13 +1,11 @@
 """Export handling for AWS CostLens reports - Local and S3."""
 
+import csv
 import os
-from io import BytesIO
-from typing import Optional
+from io import BytesIO, TextIOWrapper
+from typing import Any, BinaryIO, Callable, Iterable, Optional, Sequence, Union
 
-from rich.console import Console
-
-# Force UTF-8 and modern Windows terminal mode for Unicode support
-console = Console(force_terminal=True, legacy_windows=False)
+from aws_costlens.console_setup import console, emit
 
 
 def upload_to_s3(
@@ -32,8 +30,10 @@ def upload_to_s3(
     """
     import boto3
 
+    from aws_costlens.aws_api import get_session
+
     try:
-        session = boto3.Session(profile_name=profile) if profile else boto3.Session()
+        session = get_session(profile) if profile else boto3.Session()
         s3 = session.client("s3")
         s3.put_object(
             Bucket=bucket,
@@ -41,7 +41,45 @@ def upload_to_s3(
             Body=content,
             ContentType=content_type,
         )
-        console.print(f"[green]✓ Uploaded to s3://{bucket}/{key}[/]")
+        emit(f"✓ Uploaded to s3://{bucket}/{key}", "green")
+        return True
+    except Exception as e:
+        console.print(f"[bold red]Error uploading to S3: {str(e)}[/]")
+        return False
+
+
+def upload_file_to_s3(
+    filepath: str,
+    bucket: str,
+    key: str,
+    profile: Optional[str] = None,
+    content_type: str = "application/octet-stream",
+) -> bool:
+    """
+    Upload a local file to S3 bucket.
+
+    Uses boto3's managed transfer, which switches to multipart uploads for
+    large files instead of loading the whole file into memory.
+
+    Args:
+        filepath: Path of the local file
+        bucket: S3 bucket name
+        key: S3 object key
+        profile: Optional AWS profile
+        content_type: MIME type
+
+    Returns:
+        True if successful
+    """
+    import boto3
+
+    from aws_costlens.aws_api import get_session
+
+    try:
+        session = get_session(profile) if profile else boto3.Session()
+        s3 = session.client("s3")
+        s3.upload_file(filepath, bucket, key, ExtraArgs={"ContentType": content_type})
+        emit(f"✓ Uploaded to s3://{bucket}/{key}", "green")
         return True
     except Exception as e:
         console.print(f"[bold red]Error uploading to S3: {str(e)}[/]")
@@ -101,19 +139,64 @@ class ExportHandler:
 
         # Upload to S3 if configured
         if self.s3_bucket:
-            s3_key = f"{self.s3_prefix}/{filename}" if self.s3_prefix else filename
-            s3_key = s3_key.lstrip("/")
+            s3_key = self._s3_key(filename)
             if upload_to_s3(content, self.s3_bucket, s3_key, self.profile, content_type):
                 saved_path = f"s3://{self.s3_bucket}/{s3_key}"
 
         return saved_path
 
+    def save_stream(
+        self,
+        write: Callable[[BinaryIO], object],
+        filename: str,
+        content_type: str = "application/octet-stream",
+    ) -> str:
+        """
+        Write content directly to the local file, then upload it to S3.
+
+        Unlike save(), the full content never has to exist in memory:
+        the write callback receives the open binary file object. Its return
+        value is ignored.
+
+        Args:
+            write: Callback that writes the content to the given file object
+            filename: Name of the file
+            content_type: MIME type
+
+        Returns:
+            Path or URL where content was saved
+        """
+        filepath = os.path.join(self.output_dir, filename)
+        try:
+            with open(filepath, "wb") as f:
+                write(f)
+        except Exception:
+            # Don't leave a truncated report behind
+            if os.path.exists(filepath):
+                os.remove(filepath)
+            raise
+        emit(f"✓ Saved to {filepath}", "green")
+        saved_path = filepath
+
+        # Upload to S3 if configured
+        if self.s3_bucket:
+            s3_key = self._s3_key(filename)
+            if upload_file_to_s3(filepath, self.s3_bucket, s3_key, self.profile, content_type):
+                saved_path = f"s3://{self.s3_bucket}/{s3_key}"
+
+        return saved_path
+
+    def _s3_key(self, filename: str) -> str:
+        """Build the S3 object key for a filename."""
+        s3_key = f"{self.s3_prefix}/{filename}" if self.s3_prefix else filename
+        return s3_key.lstrip("/")
+
     def _save_to_local(self, content: bytes, filename: str) -> str:
         """Save content to local filesystem."""
         filepath = os.path.join(self.output_dir, filename)
         with open(filepath, "wb") as f:
             f.write(content)
-        console.print(f"[green]✓ Saved to {filepath}[/]")
+        emit(f"✓ Saved to {filepath}", "green")
         return filepath
 
     def save_text(self, content: str, filename: str) -> str:
@@ -124,14 +207,50 @@ class ExportHandler:
         """Save CSV content."""
         return self.save(content.encode("utf-8"), filename, "text/csv")
 
-    def save_json(self, content: str, filename: str) -> str:
-        """Save JSON content."""
-        return self.save(content.encode("utf-8"), filename, "application/json")
+    def save_csv_stream(
+        self,
+        rows: Iterable[Sequence[Any]],
+        filename: str,
+        header: Optional[Sequence[str]] = None,
+    ) -> str:
+        """Save CSV rows, writing them one by one as they are produced."""
+
+        def _write(f: BinaryIO) -> None:
+            text = TextIOWrapper(f, encoding="utf-8", newline="")
+            try:
+                writer = csv.writer(text)
+                if header:
+                    writer.writerow(header)
+                writer.writerows(rows)
+                text.flush()
+            finally:
+                # Leave closing the file to save_stream
+                text.detach()
+
+        return self.save_stream(_write, filename, "text/csv")
+
+    def save_json(self, content: Union[str, bytes], filename: str) -> str:
+        """Save JSON content (str or UTF-8 encoded bytes)."""
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        return self.save(content, filename, "application/json")
+
+    def save_json_stream(self, write: Callable[[BinaryIO], object], filename: str) -> str:
+        """Save JSON content serialized directly into the output file."""
+        return self.save_stream(write, filename, "application/json")
 
     def save_pdf(self, content: bytes, filename: str) -> str:
         """Save PDF content."""
         return self.save(content, filename, "application/pdf")
 
+    def save_pdf_stream(self, write: Callable[[BinaryIO], object], filename: str) -> str:
+        """Save PDF content built directly into the output file."""
+        return self.save_stream(write, filename, "application/pdf")
+
+    def save_parquet(self, write: Callable[[BinaryIO], object], filename: str) -> str:
+        """Save Parquet content written directly into the output file."""
+        return self.save_stream(write, filename, "application/vnd.apache.parquet")
+
     def save_xlsx(self, content: bytes, filename: str) -> str:
         """Save XLSX content."""
         return self.save(
@@ -148,5 +267,4 @@ def get_pdf_output() -> BytesIO:
 
 def finalize_pdf(buffer: BytesIO) -> bytes:
     """Finalize PDF and return bytes."""
-    buffer.seek(0)
-    return buffer.read()
+    return buffer.getvalue()
@@ -3,18 +3,24 @@
 from decimal import ROUND_HALF_UP, Decimal, getcontext
 from typing import List, Tuple
 
-from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
 # Setup UTF-8 console for Windows
-from aws_costlens.console_setup import setup_console
+from aws_costlens.console_setup import console, setup_console
 setup_console()
 
 # Set precision context for Decimal operations
 getcontext().prec = 6
 
-console = Console(force_terminal=True, legacy_windows=False)
+# Length of the bar drawn for the most expensive month
+_BAR_WIDTH = 40
+# Every bar length is one lookup instead of a string multiplication
+_BAR_CACHE = ["█" * i for i in range(_BAR_WIDTH + 1)]
+
+_CENT = Decimal("0.01")
+_HUNDRED = Decimal("100")
+_CHANGE_CAP = Decimal("999")
 
 
 def create_trend_bars(monthly_costs: List[Tuple[str, float]]) -> None:
@@ -35,36 +41,35 @@ def create_trend_bars(monthly_costs: List[Tuple[str, float]]) -> None:
         console.print("[yellow]All costs are $0.00 for this period[/]")
         return
 
-    prev_cost = None
+    prev_d = None
 
     for month, cost in monthly_costs:
         cost_d = Decimal(str(cost))
-        bar_length = int((cost / max_cost) * 40) if max_cost > 0 else 0
-        bar = "█" * bar_length
+        bar_length = int((cost / max_cost) * _BAR_WIDTH) if max_cost > 0 else 0
+        # Credits (negative costs) get an empty bar
+        bar = _BAR_CACHE[bar_length] if bar_length > 0 else ""
 
         # Default values
         bar_color = "blue"
         change = ""
 
-        if prev_cost is not None:
-            prev_d = Decimal(str(prev_cost))
-
-            if prev_d < Decimal("0.01"):
-                if cost_d < Decimal("0.01"):
+        if prev_d is not None:
+            if prev_d < _CENT:
+                if cost_d < _CENT:
                     change = "[bright_yellow]0%[/]"
                     bar_color = "yellow"
                 else:
                     change = "[bright_red]N/A[/]"
                     bar_color = "bright_red"
             else:
-                change_pct = ((cost_d - prev_d) / prev_d * Decimal("100")).quantize(
-                    Decimal("0.01"), rounding=ROUND_HALF_UP
+                change_pct = ((cost_d - prev_d) / prev_d * _HUNDRED).quantize(
+                    _CENT, rounding=ROUND_HALF_UP
                 )
 
-                if abs(change_pct) < Decimal("0.01"):
+                if abs(change_pct) < _CENT:
                     change = "[bright_yellow]0%[/]"
                     bar_color = "yellow"
-                elif abs(change_pct) > Decimal("999"):
+                elif abs(change_pct) > _CHANGE_CAP:
                     color = "bright_red" if change_pct > 0 else "bright_green"
                     change = f"[{color}]{'>+' if change_pct > 0 else '-'}999%[/]"
                     bar_color = color
@@ -75,7 +80,7 @@ def create_trend_bars(monthly_costs: List[Tuple[str, float]]) -> None:
                     bar_color = color
 
         table.add_row(month, f"${cost:,.2f}", f"[{bar_color}]{bar}[/]", change)
-        prev_cost = cost
+        prev_d = cost_d
 
     console.print(
         Panel(
@@ -0,0 +1,73 @@
+"""PDF exports that span several pages."""
+
+import re
+
+import pytest
+
+from aws_costlens.common_utils import (
+    export_audit_report_to_pdf,
+    export_cost_dashboard_to_pdf,
+)
+from aws_costlens.models import BudgetInfo
+
+_PAGE_RE = re.compile(rb"/Type /Page\b(?!s)")
+
+
+def _cost_profile(i: int) -> dict:
+    services = [(f"Service {n}", 10.0 * n) for n in range(1, 6)]
+    return {
+        "profile": f"profile-{i}",
+        "account_id": f"{i:012d}",
+        "last_month": 100.0,
+        "current_month": 150.0,
+        "service_costs": services,
+        "service_costs_formatted": [f"{s}: ${c:,.2f}" for s, c in services],
+        "previous_service_costs": services,
+        "previous_service_costs_formatted": [f"{s}: ${c:,.2f}" for s, c in services],
+        "previous_service_costs_map": dict(services),
+        "budget_info": ["🟢 Monthly: $150.00 / $1,000.00 (15.0%)"],
+        "ec2_summary": {"running": 2, "stopped": 1},
+        "ec2_summary_formatted": ["running: 2", "stopped: 1"],
+        "success": True,
+        "error": None,
+        "current_period_name": "Current Month Cost",
+        "previous_period_name": "Last Month Due",
+        "percent_change_in_total_cost": 50.0,
+    }
+
+
+def _audit_profile(i: int) -> dict:
+    return {
+        "profile": f"profile-{i}",
+        "account_id": f"{i:012d}",
+        "untagged_resources": {"EC2": {"us-east-1": ["i-0123456789abcdef0"]}},
+        "stopped_instances": {"us-east-1": ["i-1", "i-2"], "eu-west-1": ["i-3"]},
+        "unused_volumes": {"us-east-1": ["vol-1"]},
+        "unused_eips": {"us-east-1": ["203.0.113.1"]},
+        "budget_alerts": [BudgetInfo("Monthly", 100.0, 150.0, None)],
+    }
+
+
+def _page_count(pdf: bytes) -> int:
+    return len(_PAGE_RE.findall(pdf))
+
+
+@pytest.mark.parametrize("profiles", [9, 20, 30, 59])
+def test_cost_dashboard_pdf_spans_pages(profiles: int) -> None:
+    pdf = export_cost_dashboard_to_pdf(
+        [_cost_profile(i) for i in range(profiles)],
+        "report",
+        "2026-09-01 to 2026-09-30",
+        "2026-10-01 to 2026-10-14",
+    )
+    assert pdf is not None and pdf.startswith(b"%PDF")
+    assert _page_count(pdf) > 1
+
+
+@pytest.mark.parametrize("profiles", [9, 20, 30, 59])
+def test_audit_report_pdf_spans_pages(profiles: int) -> None:
+    pdf = export_audit_report_to_pdf(
+        [_audit_profile(i) for i in range(profiles)], "scan"
+    )
+    assert pdf is not None and pdf.startswith(b"%PDF")
+    assert _page_count(pdf) > 1